@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, field_serializer, model_validator
 
 
 class SourceStats(BaseModel):
@@ -16,6 +16,12 @@ class SourceStats(BaseModel):
         None, description="Date of latest article"
     )
 
+    @model_validator(mode="after")
+    def check_processed_within_total(self) -> "SourceStats":
+        if self.processed_count > self.article_count:
+            raise ValueError("processed_count cannot exceed article_count")
+        return self
+
     @field_serializer("latest_article")
     def serialize_latest_article(self, value: Optional[datetime]) -> Optional[str]:
         return value.isoformat() if value else None
@@ -1,9 +1,18 @@
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Optional C accelerator; fall back to a compiled regex
+    ahocorasick = None
 
 
 class BaseNewsSource(ABC):
+    # Every concrete source declares __slots__ too, so none carries a __dict__
+    __slots__ = ("source_name",)
+
     def __init__(self, source_name: str):
         self.source_name = source_name
 
@@ -12,17 +21,67 @@ class BaseNewsSource(ABC):
         """Fetch and filter articles"""
         pass
 
-    def filter_articles(self, articles: List[Dict], keywords: List[str]) -> List[Dict]:
-        """Filter articles by keywords"""
-        filtered = []
+    # Keyword matchers are shared by all sources, keyed by keyword tuple
+    _keyword_matchers: Dict[Tuple[str, ...], Callable[[str], bool]] = {}
+
+    @classmethod
+    def _get_keyword_matcher(cls, keywords: List[str]) -> Callable[[str], bool]:
+        """Return a cached predicate that tests lowercased text for any keyword"""
+        key = tuple(keywords)
+        matcher = cls._keyword_matchers.get(key)
+        if matcher is None:
+            lowered = [keyword.lower() for keyword in keywords]
+
+            if ahocorasick is not None and lowered and all(lowered):
+                automaton = ahocorasick.Automaton()
+                for keyword in lowered:
+                    automaton.add_word(keyword, keyword)
+                automaton.make_automaton()
+
+                def matcher(text: str) -> bool:
+                    return next(automaton.iter(text), None) is not None
+
+            elif lowered:
+                # One alternation scanned by the C regex engine; an empty
+                # keyword matches everything, exactly as a substring test would
+                pattern = re.compile("|".join(map(re.escape, lowered)))
+
+                def matcher(text: str) -> bool:
+                    return pattern.search(text) is not None
+
+            else:
+
+                def matcher(text: str) -> bool:
+                    return False
+
+            cls._keyword_matchers[key] = matcher
+        return matcher
+
+    def matches_keywords(self, title: str, summary: str, keywords: List[str]) -> bool:
+        """Check whether a title or summary mentions any of the keywords"""
+        # Newline separator stops a keyword matching across both fields
+        text = "\n".join((title, summary)).lower()
+        return self._get_keyword_matcher(keywords)(text)
+
+    def iter_filtered_articles(
+        self, articles: Iterable[Dict], keywords: List[str]
+    ) -> Iterator[Dict]:
+        """Lazily yield the articles that mention any of the keywords"""
+        matcher = self._get_keyword_matcher(keywords)
         for article in articles:
-            title = article.get("original_title", "").lower()
-            summary = article.get("original_summary", "").lower()
+            text = "\n".join(
+                (
+                    article.get("original_title", ""),
+                    article.get("original_summary", ""),
+                )
+            ).lower()
 
-            if any(keyword in title or keyword in summary for keyword in keywords):
-                filtered.append(article)
+            if matcher(text):
+                yield article
 
-        return filtered
+    def filter_articles(self, articles: List[Dict], keywords: List[str]) -> List[Dict]:
+        """Filter articles by keywords"""
+        return list(self.iter_filtered_articles(articles, keywords))
 
 
 def build_article_from_feed_entry(
@@ -13,6 +13,8 @@ import logging
 
 
 class BBCSource(BaseNewsSource):
+    __slots__ = ("feed_url",)
+
     def __init__(self):
         super().__init__("BBC News")
         self.feed_url = "http://feeds.bbci.co.uk/news/england/manchester/rss.xml"
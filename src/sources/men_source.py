@@ -13,6 +13,8 @@ import logging
 
 
 class MENSource(BaseNewsSource):
+    __slots__ = ("feed_url",)
+
     def __init__(self):
         super().__init__("Manchester Evening News")
         self.feed_url = "https://www.manchestereveningnews.co.uk/news/greater-manchester-news/?service=rss"
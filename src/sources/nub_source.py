@@ -17,6 +17,8 @@ except ImportError:
 
 
 class NubSource(BaseNewsSource):
+    __slots__ = ("base_url", "headers")
+
     def __init__(self):
         super().__init__("Stockport Nub News")
         self.base_url = "https://stockport.nub.news/news"
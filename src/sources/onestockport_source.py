@@ -13,6 +13,8 @@ except ImportError:
 
 
 class OneStockportSource(BaseNewsSource):
+    __slots__ = ("base_url",)
+
     def __init__(self):
         super().__init__("One Stockport")
         self.base_url = "https://www.onestockport.co.uk/news/"
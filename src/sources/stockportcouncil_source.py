@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime
 from typing import Dict, List
+from urllib.parse import urljoin
 
 from playwright.sync_api import sync_playwright
 
@@ -12,7 +13,42 @@ except ImportError:
     from config import Config
 
 
+# Runs inside the page and returns plain data for every candidate article.
+# Selectors are tried in order and the first one that matches anything wins.
+EXTRACT_ARTICLES_JS = """
+() => {
+    const selectors = ["article", ".news-item", ".card", "a[href*='/news/']"];
+    let elements = [];
+    let anchorsMode = false;
+    for (const selector of selectors) {
+        elements = Array.from(document.querySelectorAll(selector));
+        if (elements.length) {
+            // The news-link fallback only ever matches anchors
+            anchorsMode = selector.startsWith("a[");
+            break;
+        }
+    }
+    return elements.map((el) => {
+        const isLink = anchorsMode || el.tagName === "A";
+        const titleEl = el.querySelector("h2, h3, h4, .title") || (isLink ? el : null);
+        const linkEl = isLink ? el : el.querySelector("a");
+        const dateEl = el.querySelector("time, .date, .published, [datetime]");
+        const summaryEl = el.querySelector("p, .excerpt, .summary");
+        return {
+            title: titleEl ? titleEl.innerText.trim() : null,
+            href: linkEl ? linkEl.getAttribute("href") : null,
+            datetimeAttr: dateEl ? dateEl.getAttribute("datetime") : null,
+            dateText: dateEl ? dateEl.innerText.trim() : null,
+            summary: summaryEl ? summaryEl.innerText.trim() : "",
+        };
+    });
+}
+"""
+
+
 class StockportCouncilSource(BaseNewsSource):
+    __slots__ = ("base_url",)
+
     def __init__(self):
         super().__init__("Stockport Council")
         self.base_url = "https://www.stockport.gov.uk/landing/news-media"
@@ -51,6 +87,10 @@ class StockportCouncilSource(BaseNewsSource):
                     browser.close()
                     return []
 
+                # Resolve links against where the listing actually ended up,
+                # which may differ from base_url after redirects
+                page_url = page.url
+
                 # Wait for articles to load
                 try:
                     page.wait_for_selector("article, .news-item, .card", timeout=10000)
@@ -59,98 +99,67 @@ class StockportCouncilSource(BaseNewsSource):
                         f"Timeout waiting for articles on Stockport Council: {e}"
                     )
 
-                # Try multiple selectors to find articles
-                article_elements = page.query_selector_all("article")
-
-                if not article_elements:
-                    article_elements = page.query_selector_all(".news-item")
-
-                if not article_elements:
-                    article_elements = page.query_selector_all(".card")
-
-                if not article_elements:
-                    # Try finding any links in a news container
-                    article_elements = page.query_selector_all("a[href*='/news/']")
+                # Pull every candidate article out of the DOM in a single
+                # round-trip rather than issuing several calls per element
+                article_data_list = page.evaluate(EXTRACT_ARTICLES_JS)
 
                 logging.info(
-                    f"Found {len(article_elements)} potential articles on Stockport Council"
+                    f"Found {len(article_data_list)} potential articles on Stockport Council"
                 )
 
-                for article in article_elements:
+                for raw in article_data_list:
                     try:
-                        # Extract title
-                        title_elem = article.query_selector("h2, h3, h4, .title")
-                        if not title_elem:
-                            # If it's a link, try to get text from it
-                            if article.evaluate("el => el.tagName") == "A":
-                                title_elem = article
-
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.inner_text().strip()
+                        title = raw.get("title") or ""
 
                         if not title or len(title) < 5:
                             continue
 
-                        # Extract link
-                        if article.evaluate("el => el.tagName") == "A":
-                            link = article.get_attribute("href")
-                        else:
-                            link_elem = article.query_selector("a")
-                            if not link_elem:
-                                continue
-                            link = link_elem.get_attribute("href")
+                        # Extract summary/excerpt
+                        summary = raw.get("summary") or ""
 
+                        # Check keywords before doing any date or URL work
+                        if not self.matches_keywords(title, summary, Config.KEYWORDS):
+                            continue
+
+                        link = raw.get("href")
                         if not link:
                             continue
 
                         # Make absolute URL
-                        if link.startswith("/"):
-                            link = f"https://www.stockport.gov.uk{link}"
+                        link = urljoin(page_url, link)
 
                         # Extract date (if available)
-                        date_elem = article.query_selector(
-                            "time, .date, .published, [datetime]"
-                        )
                         pubdate = None
 
-                        if date_elem:
-                            # Try to get datetime attribute
-                            datetime_attr = date_elem.get_attribute("datetime")
-                            if datetime_attr:
-                                try:
-                                    pubdate = datetime.fromisoformat(
-                                        datetime_attr.replace("Z", "+00:00")
-                                    )
-                                except ValueError:
-                                    pass
-
-                            # Try to parse text content
-                            if not pubdate:
-                                date_text = date_elem.inner_text().strip()
-                                try:
-                                    # Try common UK date formats
-                                    for fmt in [
-                                        "%d %B %Y",
-                                        "%d/%m/%Y",
-                                        "%B %d, %Y",
-                                    ]:
-                                        try:
-                                            pubdate = datetime.strptime(date_text, fmt)
-                                            break
-                                        except ValueError:
-                                            continue
-                                except Exception as e:
-                                    logging.debug(
-                                        f"Could not parse date from Stockport Council: {e}"
-                                    )
-
-                        # Extract summary/excerpt
-                        summary_elem = article.query_selector("p, .excerpt, .summary")
-                        summary = ""
-                        if summary_elem:
-                            summary = summary_elem.inner_text().strip()
+                        # Try to get datetime attribute
+                        datetime_attr = raw.get("datetimeAttr")
+                        if datetime_attr:
+                            try:
+                                pubdate = datetime.fromisoformat(
+                                    datetime_attr.replace("Z", "+00:00")
+                                )
+                            except ValueError:
+                                pass
+
+                        # Try to parse text content
+                        date_text = raw.get("dateText")
+                        if not pubdate and date_text:
+                            try:
+                                # Try common UK date formats
+                                for fmt in [
+                                    "%d %B %Y",
+                                    "%d/%m/%Y",
+                                    "%B %d, %Y",
+                                ]:
+                                    try:
+                                        pubdate = datetime.strptime(date_text, fmt)
+                                        break
+                                    except ValueError:
+                                        continue
+                            except Exception as e:
+                                logging.debug(
+                                    f"Could not parse date from Stockport Council: {e}"
+                                )
 
                         # Build article data
                         article_data = {
@@ -170,10 +179,9 @@ class StockportCouncilSource(BaseNewsSource):
 
                 browser.close()
 
-            # Filter by keywords
-            filtered = self.filter_articles(articles, Config.KEYWORDS)
-            logging.info(f"Stockport Council: {len(filtered)} articles found")
-            return filtered
+            # Articles were keyword-filtered as they were parsed
+            logging.info(f"Stockport Council: {len(articles)} articles found")
+            return articles
 
         except Exception as e:
             logging.error(f"Stockport Council fetch error: {e}")
@@ -1,9 +1,12 @@
+import codecs
 import logging
+import re
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml.cssselect import CSSSelector
 
 from .base_source import BaseNewsSource
 
@@ -13,13 +16,62 @@ except ImportError:
     from config import Config
 
 
+# Selectors are compiled once at import; each tuple is tried in order
+_SEL_ARTICLE = CSSSelector("article.post")
+_SEL_ARTICLE_FALLBACK = CSSSelector("div.fusion-post-content")
+_SEL_TITLE_LINK = (CSSSelector("h2 a"), CSSSelector("h3 a"))
+_SEL_DATE = (CSSSelector("span.updated"), CSSSelector("time"))
+_SEL_CONTAINER = (
+    CSSSelector("div.fusion-post-content-container"),
+    CSSSelector("div.post-content"),
+)
+_SEL_PARAGRAPH = (CSSSelector("p"),)
+
+# <meta charset=...> or <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=", re.IGNORECASE)
+
+
+def _first_match(element, selectors):
+    """Return the first element matched by the first selector that hits"""
+    for selector in selectors:
+        matches = selector(element)
+        if matches:
+            return matches[0]
+    return None
+
+
+def _charset_from_headers(headers) -> Optional[str]:
+    """Return the charset declared in Content-Type, or None if there isn't one"""
+    for param in headers.get("Content-Type", "").split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            charset = value.strip().strip("'\"")
+            try:
+                return codecs.lookup(charset).name
+            except LookupError:
+                break
+    return None
+
+
 class TotallyStockportSource(BaseNewsSource):
+    __slots__ = (
+        "base_url",
+        "headers",
+        "_etag",
+        "_last_modified",
+        "_last_filtered",
+    )
+
     def __init__(self):
         super().__init__("Totally Stockport")
         self.base_url = "https://totallystockport.co.uk/latest-news/"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        # Validators from the last full fetch, used for conditional requests
+        self._etag = None
+        self._last_modified = None
+        self._last_filtered: List[Dict] = []
 
     def fetch_articles(self) -> List[Dict]:
         try:
@@ -27,49 +79,95 @@ class TotallyStockportSource(BaseNewsSource):
 
             # Fetch first page
             logging.info("Fetching Totally Stockport news...")
+            headers = dict(self.headers)
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
             response = requests.get(
-                self.base_url, headers=self.headers, timeout=Config.HTTP_TIMEOUT
+                self.base_url,
+                headers=headers,
+                timeout=Config.HTTP_TIMEOUT,
+                stream=True,
             )
-            response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            with response:
+                if response.status_code == 304:
+                    logging.info(
+                        "Totally Stockport: page not modified since last fetch"
+                    )
+                    return [dict(article) for article in self._last_filtered]
+
+                response.raise_for_status()
+
+                # Parse incrementally as the body arrives rather than
+                # buffering the whole page before building the tree
+                chunks = iter(response.iter_content(chunk_size=65536))
+                first_chunk = next(chunks, b"")
+
+                # A header charset wins; otherwise let libxml2 honour the
+                # page's <meta charset>. With neither it would assume
+                # Latin-1, so fall back to UTF-8 instead
+                encoding = _charset_from_headers(response.headers)
+                if encoding is None and not _META_CHARSET.search(first_chunk):
+                    encoding = "utf-8"
+
+                parser = lxml.html.HTMLParser(encoding=encoding)
+                parser.feed(first_chunk)
+                for chunk in chunks:
+                    parser.feed(chunk)
+                root = parser.close()
 
             # Find all article elements
             # WordPress blog layout - articles are in list items
-            article_elements = soup.find_all("article", class_="post")
+            article_elements = _SEL_ARTICLE(root)
 
             if not article_elements:
                 logging.warning(
                     "No articles found with 'post' class, trying alternative selectors"
                 )
                 # Try alternative selector
-                article_elements = soup.find_all("div", class_="fusion-post-content")
+                article_elements = _SEL_ARTICLE_FALLBACK(root)
 
             for article in article_elements:
                 try:
                     # Extract title and link
-                    title_elem = article.find("h2")
-                    if not title_elem:
-                        title_elem = article.find("h3")
-
-                    if not title_elem:
+                    link_elem = _first_match(article, _SEL_TITLE_LINK)
+                    if link_elem is None:
                         continue
 
-                    link_elem = title_elem.find("a")
-                    if not link_elem:
-                        continue
-
-                    title = link_elem.get_text().strip()
+                    title = link_elem.text_content().strip()
                     link = link_elem.get("href", "")
 
+                    # Extract summary/excerpt
+                    summary_elem = _first_match(article, _SEL_CONTAINER)
+
+                    summary = ""
+                    if summary_elem is not None:
+                        # Get text from the first paragraph or the container
+                        p = _first_match(summary_elem, _SEL_PARAGRAPH)
+                        if p is not None:
+                            summary = p.text_content().strip()
+                        else:
+                            summary = summary_elem.text_content().strip()
+
+                        # Clean up summary
+                        if "[...]" in summary:
+                            summary = summary.replace("[...]", "").strip()
+                        if "Read More" in summary:
+                            summary = summary.split("Read More")[0].strip()
+
+                    # Check keywords before doing any date parsing
+                    if not self.matches_keywords(title, summary, Config.KEYWORDS):
+                        continue
+
                     # Extract date
-                    date_elem = article.find("span", class_="updated")
-                    if not date_elem:
-                        date_elem = article.find("time")
+                    date_elem = _first_match(article, _SEL_DATE)
 
                     pubdate = None
-                    if date_elem:
-                        date_text = date_elem.get_text().strip()
+                    if date_elem is not None:
+                        date_text = date_elem.text_content().strip()
                         try:
                             # Try parsing "December 2, 2024" format
                             pubdate = datetime.strptime(date_text, "%B %d, %Y")
@@ -80,28 +178,6 @@ class TotallyStockportSource(BaseNewsSource):
                             except ValueError:
                                 logging.warning(f"Could not parse date: {date_text}")
 
-                    # Extract summary/excerpt
-                    summary_elem = article.find(
-                        "div", class_="fusion-post-content-container"
-                    )
-                    if not summary_elem:
-                        summary_elem = article.find("div", class_="post-content")
-
-                    summary = ""
-                    if summary_elem:
-                        # Get text from the first paragraph or the container
-                        p = summary_elem.find("p")
-                        if p:
-                            summary = p.get_text().strip()
-                        else:
-                            summary = summary_elem.get_text().strip()
-
-                        # Clean up summary
-                        if "[...]" in summary:
-                            summary = summary.replace("[...]", "").strip()
-                        if "Read More" in summary:
-                            summary = summary.split("Read More")[0].strip()
-
                     # Build article data
                     article_data = {
                         "original_title": title,
@@ -118,10 +194,14 @@ class TotallyStockportSource(BaseNewsSource):
                     logging.error(f"Error parsing Totally Stockport article: {e}")
                     continue
 
-            # Filter by keywords
-            filtered = self.filter_articles(articles, Config.KEYWORDS)
-            logging.info(f"Totally Stockport: {len(filtered)} articles found")
-            return filtered
+            # Articles were keyword-filtered as they were parsed
+            logging.info(f"Totally Stockport: {len(articles)} articles found")
+
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            # Keep our own copies so callers can't alter what a 304 serves
+            self._last_filtered = [dict(article) for article in articles]
+            return articles
 
         except Exception as e:
             logging.error(f"Totally Stockport fetch error: {e}")
@@ -2,40 +2,88 @@
 """
 Test fixtures and configuration for API tests
 """
-import os
-import sys
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from unittest.mock import Mock
+from types import MappingProxyType
+from typing import Optional
+from unittest.mock import Mock, create_autospec
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
-# Add src to path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))  # noqa
+from api.app import app
+from api.routes.articles import get_db as get_articles_db
+from api.routes.sources import get_db as get_sources_db
+from api.schemas.articles import ArticleSummary, PaginationInfo
+from api.schemas.sources import SourceStats
+from database.api_operations import APIOperations
 
-from api.app import app  # noqa
-from api.routes.articles import get_db as get_articles_db  # noqa
-from api.routes.sources import get_db as get_sources_db  # noqa
-from database.models import RSSArticle  # noqa
+
+@dataclass(slots=True, frozen=True)
+class ArticleStub:
+    """Read-only stand-in for RSSArticle with the columns the API reads"""
+
+    id: int
+    original_title: str
+    original_link: str
+    original_summary: Optional[str]
+    original_source: str
+    source_type: Optional[str]
+    original_pubdate: Optional[datetime]
+    url_hash: Optional[str]
+    created_at: Optional[datetime]
+    processed: bool
+    extracted_content: Optional[str]
+    ai_summary: Optional[str]
+    image_url: Optional[str]
+    updated_at: Optional[datetime]
+
+
+@pytest.fixture(scope="session")
+def api_app():
+    """FastAPI application built once at import and shared by the session"""
+    return app
+
+
+@pytest.fixture(scope="session")
+def _app_client(api_app):
+    """FastAPI test client shared across the whole test session"""
+    return TestClient(api_app)
 
 
 @pytest.fixture
-def client(mock_api_operations):
-    """FastAPI test client with mocked database dependencies"""
+def db_overrides(api_app, mock_api_operations):
+    """Route the app's database dependencies to mock_api_operations"""
 
     # Override the dependencies
     def override_get_db():
         yield mock_api_operations
 
-    app.dependency_overrides[get_articles_db] = override_get_db
-    app.dependency_overrides[get_sources_db] = override_get_db
-
-    test_client = TestClient(app)
+    api_app.dependency_overrides[get_articles_db] = override_get_db
+    api_app.dependency_overrides[get_sources_db] = override_get_db
 
-    yield test_client
+    yield
 
     # Clean up overrides
-    app.dependency_overrides.clear()
+    api_app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(_app_client, db_overrides):
+    """FastAPI test client with mocked database dependencies"""
+    return _app_client
+
+
+@pytest_asyncio.fixture
+async def async_client(api_app, db_overrides):
+    """In-process ASGI client with mocked database dependencies"""
+    transport = httpx.ASGITransport(app=api_app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as async_client:
+        yield async_client
 
 
 @pytest.fixture
@@ -46,10 +94,41 @@ def mock_api_operations():
     return mock_ops
 
 
+@pytest.fixture(scope="session")
+def _api_ops_template():
+    """Autospec of an APIOperations instance, built once per session"""
+    return create_autospec(APIOperations, instance=True)
+
+
 @pytest.fixture
+def app_api_ops(_api_ops_template, monkeypatch):
+    """Autospec APIOperations instance returned by api.app.APIOperations()"""
+    _api_ops_template.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(
+        "api.app.APIOperations", lambda *args, **kwargs: _api_ops_template
+    )
+    return _api_ops_template
+
+
+@pytest.fixture
+def mock_query_chain():
+    """Mock SQLAlchemy query whose chaining methods return itself"""
+    mock_query = Mock()
+    for method in ("filter", "order_by", "offset", "limit", "group_by"):
+        getattr(mock_query, method).return_value = mock_query
+    return mock_query
+
+
+@pytest.fixture(scope="session")
+def now():
+    """Reference time shared by all time-relative fixtures in the session"""
+    return datetime.now()
+
+
+@pytest.fixture(scope="session")
 def sample_article():
-    """Sample article for testing"""
-    return RSSArticle(
+    """Sample article shared by the session; tests must not modify it"""
+    return ArticleStub(
         id=1,
         original_title="Test Article Title",
         original_link="https://example.com/test-article",
@@ -67,12 +146,11 @@ def sample_article():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_articles():
-    """List of sample articles for testing"""
-    articles = []
-    for i in range(1, 6):
-        article = RSSArticle(
+    """Sample articles shared by the session as an immutable tuple"""
+    return tuple(
+        ArticleStub(
             id=i,
             original_title=f"Test Article {i}",
             original_link=f"https://example.com/test-article-{i}",
@@ -88,17 +166,15 @@ def sample_articles():
             image_url=f"https://example.com/image{i}.jpg",
             updated_at=datetime(2024, 1, 15 + i, 10, 40, 0),
         )
-        articles.append(article)
-    return articles
+        for i in range(1, 6)
+    )
 
 
-@pytest.fixture
-def sample_recent_articles():
-    """Recent articles for testing"""
-    now = datetime.now()
-    articles = []
-    for i in range(3):
-        article = RSSArticle(
+@pytest.fixture(scope="session")
+def sample_recent_articles(now):
+    """Recent articles relative to ``now``, shared by the session as a tuple"""
+    return tuple(
+        ArticleStub(
             id=i + 10,
             original_title=f"Recent Article {i + 1}",
             original_link=f"https://example.com/recent-{i + 1}",
@@ -114,30 +190,69 @@ def sample_recent_articles():
             image_url=f"https://example.com/recent{i + 1}.jpg",
             updated_at=now - timedelta(hours=i),
         )
-        articles.append(article)
-    return articles
+        for i in range(3)
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sources_stats():
-    """Sample source statistics"""
-    return [
-        {
-            "name": "BBC News",
-            "article_count": 25,
-            "processed_count": 23,
-            "latest_article": "2024-01-20T15:30:00",
-        },
-        {
-            "name": "Manchester Evening News",
-            "article_count": 18,
-            "processed_count": 16,
-            "latest_article": "2024-01-20T14:20:00",
-        },
-        {
-            "name": "Stockport Nub News",
-            "article_count": 12,
-            "processed_count": 12,
-            "latest_article": "2024-01-20T13:10:00",
-        },
-    ]
+    """Sample source statistics shared by the session as read-only mappings"""
+    return tuple(
+        MappingProxyType(source)
+        for source in (
+            {
+                "name": "BBC News",
+                "article_count": 25,
+                "processed_count": 23,
+                "latest_article": "2024-01-20T15:30:00",
+            },
+            {
+                "name": "Manchester Evening News",
+                "article_count": 18,
+                "processed_count": 16,
+                "latest_article": "2024-01-20T14:20:00",
+            },
+            {
+                "name": "Stockport Nub News",
+                "article_count": 12,
+                "processed_count": 12,
+                "latest_article": "2024-01-20T13:10:00",
+            },
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_article_summary():
+    """Validated ArticleSummary shared by the session"""
+    return ArticleSummary(
+        id=1,
+        title="Test Article",
+        link="https://example.com/article",
+        source="Test Source",
+        created_at=datetime(2024, 1, 15, 10, 35, 0),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_pagination():
+    """Validated single-page PaginationInfo shared by the session"""
+    return PaginationInfo(
+        page=1,
+        per_page=20,
+        total_items=1,
+        total_pages=1,
+        has_next=False,
+        has_prev=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_source_stats_model():
+    """Validated SourceStats shared by the session"""
+    return SourceStats(
+        name="BBC News",
+        article_count=25,
+        processed_count=23,
+        latest_article=datetime(2024, 1, 20, 15, 30, 0),
+    )
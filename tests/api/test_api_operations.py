@@ -2,20 +2,36 @@
 """
 Comprehensive test suite for APIOperations class
 """
-import os
-import sys
-from datetime import datetime
+import logging
 from unittest.mock import Mock, patch
 
+import pytest
+from sqlalchemy.orm import Session
+
 from database.api_operations import APIOperations
 
-# Add src to path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+LOGGER_NAME = "database.api_operations"
 
 
 class TestAPIOperations:
     """Test suite for APIOperations class"""
 
+    @pytest.fixture(autouse=True, scope="class")
+    def _patch_db_init(self):
+        """Skip the real database connection for every test in the class"""
+        with patch(
+            "database.api_operations.DatabaseOperations.__init__", return_value=None
+        ) as mock_init:
+            yield mock_init
+
+    @pytest.fixture
+    def api_ops(self):
+        """APIOperations with a spec'd session and a real logger"""
+        api_ops = APIOperations()
+        api_ops.session = Mock(spec=Session)
+        api_ops.logger = logging.getLogger(LOGGER_NAME)
+        return api_ops
+
     @patch("database.api_operations.DatabaseOperations.__init__")
     def test_initialization(self, mock_init):
         """Test APIOperations initializes correctly"""
@@ -26,23 +42,14 @@ class TestAPIOperations:
         assert isinstance(api_ops, APIOperations)
         mock_init.assert_called_once()
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_articles_paginated_success(self, mock_init, sample_articles):
+    def test_get_articles_paginated_success(
+        self, api_ops, mock_query_chain, sample_articles
+    ):
         """Test successful paginated article retrieval"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 25
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = sample_articles[:3]
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.count.return_value = 25
+        mock_query_chain.all.return_value = sample_articles[:3]
+        api_ops.session.query.return_value = mock_query_chain
 
         articles, total_count = api_ops.get_articles_paginated(page=1, per_page=3)
 
@@ -50,25 +57,14 @@ class TestAPIOperations:
         assert total_count == 25
         assert articles[0].original_title == "Test Article 1"
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
     def test_get_articles_paginated_with_source_filter(
-        self, mock_init, sample_articles
+        self, api_ops, mock_query_chain, sample_articles
     ):
         """Test paginated articles with source filter"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 8
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = [sample_articles[0], sample_articles[3]]
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.count.return_value = 8
+        mock_query_chain.all.return_value = [sample_articles[0], sample_articles[3]]
+        api_ops.session.query.return_value = mock_query_chain
 
         articles, total_count = api_ops.get_articles_paginated(
             page=1, per_page=20, source="Test Source 1"
@@ -79,138 +75,89 @@ class TestAPIOperations:
         # Verify source filter was applied
         api_ops.session.query.return_value.filter.assert_called()
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_articles_paginated_validation(self, mock_init):
+    @pytest.mark.parametrize(
+        "page,per_page,expected_offset,expected_limit",
+        [
+            (-1, 150, 0, 100),
+            (0, 20, 0, 20),
+            (1, 101, 0, 100),
+            (1, 100, 0, 100),
+        ],
+    )
+    def test_get_articles_paginated_validation(
+        self, api_ops, mock_query_chain, page, per_page, expected_offset, expected_limit
+    ):
         """Test pagination parameter validation"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 0
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = []
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.count.return_value = 0
+        mock_query_chain.all.return_value = []
+        api_ops.session.query.return_value = mock_query_chain
 
         # Test parameter validation
-        articles, total_count = api_ops.get_articles_paginated(page=-1, per_page=150)
+        articles, total_count = api_ops.get_articles_paginated(
+            page=page, per_page=per_page
+        )
 
-        # Check that offset is calculated correctly (page should be normalized to 1)
-        mock_query.offset.assert_called_with(0)  # (1-1) * per_page
-        # Check that per_page is capped at 100
-        mock_query.limit.assert_called_with(100)
+        # Page is normalized to at least 1 and per_page is capped at 100
+        mock_query_chain.offset.assert_called_with(expected_offset)
+        mock_query_chain.limit.assert_called_with(expected_limit)
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_recent_articles_success(self, mock_init, sample_recent_articles):
+    def test_get_recent_articles_success(
+        self, api_ops, mock_query_chain, sample_recent_articles
+    ):
         """Test successful recent articles retrieval"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = sample_recent_articles
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.all.return_value = sample_recent_articles
+        api_ops.session.query.return_value = mock_query_chain
 
         articles = api_ops.get_recent_articles(hours=24, limit=10)
 
         assert len(articles) == 3
         assert articles[0].original_title == "Recent Article 1"
         # Verify limit was applied
-        mock_query.limit.assert_called_with(10)
+        mock_query_chain.limit.assert_called_with(10)
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_recent_articles_validation(self, mock_init):
+    @pytest.mark.parametrize(
+        "limit,expected_limit", [(150, 100), (0, 1), (-5, 1), (100, 100)]
+    )
+    def test_get_recent_articles_validation(
+        self, api_ops, mock_query_chain, limit, expected_limit
+    ):
         """Test recent articles parameter validation"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = []
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.all.return_value = []
+        api_ops.session.query.return_value = mock_query_chain
 
-        # Test limit validation (should cap at 100)
-        api_ops.get_recent_articles(hours=24, limit=150)
+        # Limit is clamped to the 1..100 range
+        api_ops.get_recent_articles(hours=24, limit=limit)
 
-        mock_query.limit.assert_called_with(100)
+        mock_query_chain.limit.assert_called_with(expected_limit)
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_search_articles_success(self, mock_init, sample_articles):
+    def test_search_articles_success(self, api_ops, mock_query_chain, sample_articles):
         """Test successful article search"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 5
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = sample_articles[:2]
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.count.return_value = 5
+        mock_query_chain.all.return_value = sample_articles[:2]
+        api_ops.session.query.return_value = mock_query_chain
 
         articles, total_count = api_ops.search_articles("test", page=1, per_page=2)
 
         assert len(articles) == 2
         assert total_count == 5
         # Verify search filter was applied
-        mock_query.filter.assert_called()
-
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_search_articles_empty_query(self, mock_init):
-        """Test search with empty query"""
-        mock_init.return_value = None
+        mock_query_chain.filter.assert_called()
 
-        api_ops = APIOperations()
-
-        # Test with empty string
-        articles, total_count = api_ops.search_articles("", page=1, per_page=20)
+    @pytest.mark.parametrize("query", ["", "  ", "a"])
+    def test_search_articles_empty_query(self, api_ops, query):
+        """Test search with empty, whitespace-only or single character query"""
+        articles, total_count = api_ops.search_articles(query, page=1, per_page=20)
         assert articles == []
         assert total_count == 0
 
-        # Test with whitespace only
-        articles, total_count = api_ops.search_articles("  ", page=1, per_page=20)
-        assert articles == []
-        assert total_count == 0
-
-        # Test with single character
-        articles, total_count = api_ops.search_articles("a", page=1, per_page=20)
-        assert articles == []
-        assert total_count == 0
-
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_articles_by_source(self, mock_init, sample_articles):
+    def test_get_articles_by_source(self, api_ops, mock_query_chain, sample_articles):
         """Test getting articles by source"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 10
-        mock_query.order_by.return_value = mock_query
-        mock_query.offset.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = sample_articles[:3]
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.count.return_value = 10
+        mock_query_chain.all.return_value = sample_articles[:3]
+        api_ops.session.query.return_value = mock_query_chain
 
         articles, total_count = api_ops.get_articles_by_source(
             "Test Source", page=1, per_page=3
@@ -219,20 +166,11 @@ class TestAPIOperations:
         assert len(articles) == 3
         assert total_count == 10
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_article_by_id_success(self, mock_init, sample_article):
+    def test_get_article_by_id_success(self, api_ops, mock_query_chain, sample_article):
         """Test successful single article retrieval"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = sample_article
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.first.return_value = sample_article
+        api_ops.session.query.return_value = mock_query_chain
 
         article = api_ops.get_article_by_id(1)
 
@@ -240,50 +178,39 @@ class TestAPIOperations:
         assert article.id == 1
         assert article.original_title == "Test Article Title"
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_article_by_id_not_found(self, mock_init):
+    def test_get_article_by_id_not_found(self, api_ops, mock_query_chain):
         """Test article not found"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = None
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.first.return_value = None
+        api_ops.session.query.return_value = mock_query_chain
 
         article = api_ops.get_article_by_id(999)
 
         assert article is None
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_article_by_id_exception(self, mock_init):
-        """Test article retrieval with exception"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
-        # Mock exception
+    @pytest.mark.parametrize(
+        "method,args,expected",
+        [
+            ("get_article_by_id", (1,), None),
+            ("get_sources_with_stats", (), []),
+            ("get_article_count", (), 0),
+        ],
+    )
+    def test_database_exception_paths(self, api_ops, caplog, method, args, expected):
+        """Test query failures are logged and return an empty result"""
         api_ops.session.query.side_effect = Exception("Database error")
 
-        article = api_ops.get_article_by_id(1)
+        with caplog.at_level(logging.ERROR, logger=LOGGER_NAME):
+            assert getattr(api_ops, method)(*args) == expected
 
-        assert article is None
-        api_ops.logger.error.assert_called_once()
+        assert len(caplog.records) == 1
+        assert "Database error" in caplog.records[0].getMessage()
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_sources_with_stats_success(self, mock_init, sample_sources_stats):
+    def test_get_sources_with_stats_success(
+        self, api_ops, mock_query_chain, sample_sources_stats
+    ):
         """Test successful source statistics retrieval"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
+        from datetime import datetime
 
         # Mock query results
         mock_results = []
@@ -297,12 +224,8 @@ class TestAPIOperations:
             )
             mock_results.append(mock_result)
 
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.group_by.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.all.return_value = mock_results
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.all.return_value = mock_results
+        api_ops.session.query.return_value = mock_query_chain
 
         sources = api_ops.get_sources_with_stats()
 
@@ -311,89 +234,31 @@ class TestAPIOperations:
         assert sources[0]["article_count"] == 25
         assert sources[0]["processed_count"] == 23
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_sources_with_stats_exception(self, mock_init):
-        """Test source statistics retrieval with exception"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
-        # Mock exception
-        api_ops.session.query.side_effect = Exception("Database error")
-
-        sources = api_ops.get_sources_with_stats()
-
-        assert sources == []
-        api_ops.logger.error.assert_called_once()
-
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_article_count_success(self, mock_init):
+    def test_get_article_count_success(self, api_ops, mock_query_chain):
         """Test successful article count"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.count.return_value = 42
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.count.return_value = 42
+        api_ops.session.query.return_value = mock_query_chain
 
         count = api_ops.get_article_count(processed_only=True)
 
         assert count == 42
-        mock_query.filter.assert_called_once()
+        mock_query_chain.filter.assert_called_once()
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_article_count_all_articles(self, mock_init):
+    def test_get_article_count_all_articles(self, api_ops, mock_query_chain):
         """Test article count including unprocessed"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
         # Mock query chain
-        mock_query = Mock()
-        mock_query.count.return_value = 55
-        api_ops.session.query.return_value = mock_query
+        mock_query_chain.count.return_value = 55
+        api_ops.session.query.return_value = mock_query_chain
 
         count = api_ops.get_article_count(processed_only=False)
 
         assert count == 55
         # Should not call filter when processed_only=False
-        mock_query.filter.assert_not_called()
-
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_get_article_count_exception(self, mock_init):
-        """Test article count with exception"""
-        mock_init.return_value = None
+        mock_query_chain.filter.assert_not_called()
 
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
-        # Mock exception
-        api_ops.session.query.side_effect = Exception("Database error")
-
-        count = api_ops.get_article_count()
-
-        assert count == 0
-        api_ops.logger.error.assert_called_once()
-
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_health_check_healthy(self, mock_init):
+    def test_health_check_healthy(self, api_ops):
         """Test healthy system health check"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
         # Mock successful operations
         api_ops.get_article_count = Mock(return_value=100)
         api_ops.get_recent_articles = Mock(return_value=[Mock(), Mock()])
@@ -407,24 +272,19 @@ class TestAPIOperations:
         assert health["database_connected"] is True
         assert "timestamp" in health
 
-    @patch("database.api_operations.DatabaseOperations.__init__")
-    def test_health_check_unhealthy(self, mock_init):
+    def test_health_check_unhealthy(self, api_ops, caplog):
         """Test unhealthy system health check"""
-        mock_init.return_value = None
-
-        api_ops = APIOperations()
-        api_ops.session = Mock()
-        api_ops.logger = Mock()
-
         # Mock database failure
         api_ops.get_article_count = Mock(
             side_effect=Exception("Database connection failed")
         )
 
-        health = api_ops.health_check()
+        with caplog.at_level(logging.ERROR, logger=LOGGER_NAME):
+            health = api_ops.health_check()
 
         assert health["status"] == "unhealthy"
         assert health["database_connected"] is False
         assert "error" in health
         assert "timestamp" in health
-        api_ops.logger.error.assert_called_once()
+        assert len(caplog.records) == 1
+        assert "Health check failed" in caplog.records[0].getMessage()
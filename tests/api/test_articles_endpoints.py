@@ -2,19 +2,36 @@
 """
 Comprehensive test suite for Articles API endpoints
 """
-import os
-import sys
-
+import pytest
 from fastapi import status
 
-# Add src to path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
-
+# Expected pagination blocks, built once and compared whole
+EXPECTED_PAGINATION_P1_PP2 = {
+    "page": 1,
+    "per_page": 2,
+    "total_items": 10,
+    "total_pages": 5,
+    "has_next": True,
+    "has_prev": False,
+}
+EXPECTED_PAGINATION_P3_PP10 = {
+    "page": 3,
+    "per_page": 10,
+    "total_items": 47,
+    "total_pages": 5,  # ceil(47/10)
+    "has_next": True,  # page 3 of 5
+    "has_prev": True,
+}
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
 class TestArticlesEndpoints:
     """Test suite for Articles API endpoints"""
 
-    def test_get_articles_success(self, client, mock_api_operations, sample_articles):
+    async def test_get_articles_success(
+        self, async_client, mock_api_operations, sample_articles
+    ):
         """Test successful articles retrieval"""
         # Setup mock
         mock_api_operations.get_articles_paginated.return_value = (
@@ -23,20 +40,14 @@ class TestArticlesEndpoints:
         )
 
         # Make request
-        response = client.get("/api/v1/articles?page=1&per_page=2")
+        response = await async_client.get("/api/v1/articles?page=1&per_page=2")
 
         # Assertions
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
 
-        assert "articles" in data
-        assert "pagination" in data
         assert len(data["articles"]) == 2
-        assert data["pagination"]["total_items"] == 10
-        assert data["pagination"]["page"] == 1
-        assert data["pagination"]["per_page"] == 2
-        assert data["pagination"]["has_next"] is True
-        assert data["pagination"]["has_prev"] is False
+        assert data["pagination"] == EXPECTED_PAGINATION_P1_PP2
 
         # Verify article structure
         article = data["articles"][0]
@@ -45,8 +56,8 @@ class TestArticlesEndpoints:
         assert article["link"] == "https://example.com/test-article-1"
         assert article["source"] == "Test Source 2"  # i=1: 1%3+1=2
 
-    def test_get_articles_with_source_filter(
-        self, client, mock_api_operations, sample_articles
+    async def test_get_articles_with_source_filter(
+        self, async_client, mock_api_operations, sample_articles
     ):
         """Test articles retrieval with source filter"""
         # Setup mock
@@ -56,7 +67,7 @@ class TestArticlesEndpoints:
         )
 
         # Make request
-        response = client.get("/api/v1/articles?source=Test Source 1")
+        response = await async_client.get("/api/v1/articles?source=Test Source 1")
 
         # Assertions
         assert response.status_code == status.HTTP_200_OK
@@ -68,48 +79,60 @@ class TestArticlesEndpoints:
             page=1, per_page=20, source="Test Source 1", processed_only=True
         )
 
-    def test_get_articles_validation(self, client, mock_api_operations):
+    async def test_get_articles_validation(self, async_client, mock_api_operations):
         """Test articles endpoint parameter validation"""
         # Setup mock
         mock_api_operations.get_articles_paginated.return_value = ([], 0)
 
         # Test invalid page number
-        response = client.get("/api/v1/articles?page=0")
+        response = await async_client.get("/api/v1/articles?page=0")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
         # Test invalid per_page (too high)
-        response = client.get("/api/v1/articles?per_page=101")
+        response = await async_client.get("/api/v1/articles?per_page=101")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
         # Test valid edge cases
-        response = client.get("/api/v1/articles?page=1&per_page=100")
+        response = await async_client.get("/api/v1/articles?page=1&per_page=100")
         assert response.status_code == status.HTTP_200_OK
 
-    def test_get_articles_database_error(self, client, mock_api_operations):
-        """Test articles endpoint with database error"""
+    @pytest.mark.parametrize(
+        "method,url,message",
+        [
+            (
+                "get_articles_paginated",
+                "/api/v1/articles",
+                "Failed to retrieve articles",
+            ),
+            ("get_article_by_id", "/api/v1/articles/1", "Failed to retrieve article"),
+            ("search_articles", "/api/v1/articles/search?query=test", "Search failed"),
+        ],
+    )
+    async def test_database_errors(
+        self, async_client, mock_api_operations, method, url, message
+    ):
+        """Test articles endpoints with database errors"""
         # Setup mock to raise exception
-        mock_api_operations.get_articles_paginated.side_effect = Exception(
-            "Database connection failed"
-        )
+        getattr(mock_api_operations, method).side_effect = Exception("Database error")
 
         # Make request
-        response = client.get("/api/v1/articles")
+        response = await async_client.get(url)
 
         # Assertions
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         data = response.json()
         assert "error" in data
-        assert "Failed to retrieve articles" in data["error"]
+        assert message in data["error"]
 
-    def test_get_article_by_id_success(
-        self, client, mock_api_operations, sample_article
+    async def test_get_article_by_id_success(
+        self, async_client, mock_api_operations, sample_article
     ):
         """Test successful single article retrieval"""
         # Setup mock
         mock_api_operations.get_article_by_id.return_value = sample_article
 
         # Make request
-        response = client.get("/api/v1/articles/1")
+        response = await async_client.get("/api/v1/articles/1")
 
         # Assertions
         assert response.status_code == status.HTTP_200_OK
@@ -124,13 +147,13 @@ class TestArticlesEndpoints:
         assert data["ai_summary"] == "AI generated summary"
         assert data["processed"] is True
 
-    def test_get_article_by_id_not_found(self, client, mock_api_operations):
+    async def test_get_article_by_id_not_found(self, async_client, mock_api_operations):
         """Test single article retrieval when not found"""
         # Setup mock
         mock_api_operations.get_article_by_id.return_value = None
 
         # Make request
-        response = client.get("/api/v1/articles/999")
+        response = await async_client.get("/api/v1/articles/999")
 
         # Assertions
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -138,29 +161,15 @@ class TestArticlesEndpoints:
         assert "error" in data
         assert "Article with ID 999 not found" in data["error"]
 
-    def test_get_article_by_id_database_error(self, client, mock_api_operations):
-        """Test single article retrieval with database error"""
-        # Setup mock to raise exception
-        mock_api_operations.get_article_by_id.side_effect = Exception("Database error")
-
-        # Make request
-        response = client.get("/api/v1/articles/1")
-
-        # Assertions
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-        assert "error" in data
-        assert "Failed to retrieve article" in data["error"]
-
-    def test_get_recent_articles_success(
-        self, client, mock_api_operations, sample_recent_articles
+    async def test_get_recent_articles_success(
+        self, async_client, mock_api_operations, sample_recent_articles
     ):
         """Test successful recent articles retrieval"""
         # Setup mock
         mock_api_operations.get_recent_articles.return_value = sample_recent_articles
 
         # Make request
-        response = client.get("/api/v1/articles/recent?hours=12&limit=10")
+        response = await async_client.get("/api/v1/articles/recent?hours=12&limit=10")
 
         # Assertions
         assert response.status_code == status.HTTP_200_OK
@@ -176,13 +185,15 @@ class TestArticlesEndpoints:
             hours=12, limit=10
         )
 
-    def test_get_recent_articles_defaults(self, client, mock_api_operations):
+    async def test_get_recent_articles_defaults(
+        self, async_client, mock_api_operations
+    ):
         """Test recent articles with default parameters"""
         # Setup mock
         mock_api_operations.get_recent_articles.return_value = []
 
         # Make request without parameters
-        response = client.get("/api/v1/articles/recent")
+        response = await async_client.get("/api/v1/articles/recent")
 
         # Assertions
         assert response.status_code == status.HTTP_200_OK
@@ -192,31 +203,35 @@ class TestArticlesEndpoints:
             hours=24, limit=50
         )
 
-    def test_get_recent_articles_validation(self, client, mock_api_operations):
+    async def test_get_recent_articles_validation(
+        self, async_client, mock_api_operations
+    ):
         """Test recent articles parameter validation"""
         # Test invalid hours (too high)
-        response = client.get("/api/v1/articles/recent?hours=200")
+        response = await async_client.get("/api/v1/articles/recent?hours=200")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
         # Test invalid limit (too high)
-        response = client.get("/api/v1/articles/recent?limit=150")
+        response = await async_client.get("/api/v1/articles/recent?limit=150")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
         # Test valid edge cases
         mock_api_operations.get_recent_articles.return_value = []
 
-        response = client.get("/api/v1/articles/recent?hours=168&limit=100")
+        response = await async_client.get("/api/v1/articles/recent?hours=168&limit=100")
         assert response.status_code == status.HTTP_200_OK
 
-    def test_search_articles_success(
-        self, client, mock_api_operations, sample_articles
+    async def test_search_articles_success(
+        self, async_client, mock_api_operations, sample_articles
     ):
         """Test successful article search"""
         # Setup mock
         mock_api_operations.search_articles.return_value = (sample_articles[:2], 5)
 
         # Make request
-        response = client.get("/api/v1/articles/search?query=test&page=1&per_page=2")
+        response = await async_client.get(
+            "/api/v1/articles/search?query=test&page=1&per_page=2"
+        )
 
         # Assertions
         assert response.status_code == status.HTTP_200_OK
@@ -232,23 +247,23 @@ class TestArticlesEndpoints:
             query="test", page=1, per_page=2
         )
 
-    def test_search_articles_empty_query(self, client, mock_api_operations):
+    async def test_search_articles_empty_query(self, async_client, mock_api_operations):
         """Test search with empty query"""
         # Test missing query
-        response = client.get("/api/v1/articles/search")
+        response = await async_client.get("/api/v1/articles/search")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
         # Test query too short
-        response = client.get("/api/v1/articles/search?query=a")
+        response = await async_client.get("/api/v1/articles/search?query=a")
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    def test_search_articles_no_results(self, client, mock_api_operations):
+    async def test_search_articles_no_results(self, async_client, mock_api_operations):
         """Test search with no results"""
         # Setup mock
         mock_api_operations.search_articles.return_value = ([], 0)
 
         # Make request
-        response = client.get("/api/v1/articles/search?query=nonexistent")
+        response = await async_client.get("/api/v1/articles/search?query=nonexistent")
 
         # Assertions
         assert response.status_code == status.HTTP_200_OK
@@ -258,24 +273,8 @@ class TestArticlesEndpoints:
         assert data["pagination"]["total_items"] == 0
         assert data["pagination"]["total_pages"] == 0
 
-    def test_search_articles_database_error(self, client, mock_api_operations):
-        """Test search with database error"""
-        # Setup mock to raise exception
-        mock_api_operations.search_articles.side_effect = Exception(
-            "Search index error"
-        )
-
-        # Make request
-        response = client.get("/api/v1/articles/search?query=test")
-
-        # Assertions
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-        assert "error" in data
-        assert "Search failed" in data["error"]
-
-    def test_pagination_info_calculation(
-        self, client, mock_api_operations, sample_articles
+    async def test_pagination_info_calculation(
+        self, async_client, mock_api_operations, sample_articles
     ):
         """Test pagination information calculation"""
         # Setup mock - 47 total items, page 3, 10 per page
@@ -285,26 +284,20 @@ class TestArticlesEndpoints:
         )
 
         # Make request
-        response = client.get("/api/v1/articles?page=3&per_page=10")
+        response = await async_client.get("/api/v1/articles?page=3&per_page=10")
 
         # Assertions
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
 
-        pagination = data["pagination"]
-        assert pagination["page"] == 3
-        assert pagination["per_page"] == 10
-        assert pagination["total_items"] == 47
-        assert pagination["total_pages"] == 5  # ceil(47/10)
-        assert pagination["has_next"] is True  # page 3 of 5
-        assert pagination["has_prev"] is True  # page 3
+        assert data["pagination"] == EXPECTED_PAGINATION_P3_PP10
 
-    def test_pagination_edge_cases(self, client, mock_api_operations):
+    async def test_pagination_edge_cases(self, async_client, mock_api_operations):
         """Test pagination edge cases"""
 
         # Test last page
         mock_api_operations.get_articles_paginated.return_value = ([], 25)
-        response = client.get("/api/v1/articles?page=3&per_page=10")
+        response = await async_client.get("/api/v1/articles?page=3&per_page=10")
 
         assert response.status_code == status.HTTP_200_OK
         pagination = response.json()["pagination"]
@@ -315,7 +308,7 @@ class TestArticlesEndpoints:
 
         # Test first page
         mock_api_operations.get_articles_paginated.return_value = ([], 25)
-        response = client.get("/api/v1/articles?page=1&per_page=10")
+        response = await async_client.get("/api/v1/articles?page=1&per_page=10")
 
         assert response.status_code == status.HTTP_200_OK
         pagination = response.json()["pagination"]
@@ -324,7 +317,7 @@ class TestArticlesEndpoints:
 
         # Test empty results
         mock_api_operations.get_articles_paginated.return_value = ([], 0)
-        response = client.get("/api/v1/articles?page=1&per_page=10")
+        response = await async_client.get("/api/v1/articles?page=1&per_page=10")
 
         assert response.status_code == status.HTTP_200_OK
         pagination = response.json()["pagination"]
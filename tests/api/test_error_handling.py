@@ -2,32 +2,23 @@
 """
 Comprehensive test suite for API error handling
 """
-import os
-import sys
-from unittest.mock import Mock, patch
-
+import pytest
 from fastapi import status
 
-# Add src to path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
 
 class TestHealthEndpoint:
     """Test suite for health endpoint"""
 
-    @patch("api.app.APIOperations")
-    def test_health_check_healthy(self, mock_api_operations_class, client):
+    def test_health_check_healthy(self, app_api_ops, client):
         """Test healthy health check"""
         # Setup mock
-        mock_api_operations = Mock()
-        mock_api_operations.health_check.return_value = {
+        app_api_ops.health_check.return_value = {
             "status": "healthy",
             "total_articles": 100,
             "recent_articles_24h": 5,
             "database_connected": True,
             "timestamp": "2024-01-15T10:30:00",
         }
-        mock_api_operations_class.return_value = mock_api_operations
 
         # Make request
         response = client.get("/health")
@@ -42,21 +33,18 @@ class TestHealthEndpoint:
         assert data["database_connected"] is True
 
         # Verify database operations were called and closed
-        mock_api_operations.health_check.assert_called_once()
-        mock_api_operations.close.assert_called_once()
+        app_api_ops.health_check.assert_called_once()
+        app_api_ops.close.assert_called_once()
 
-    @patch("api.app.APIOperations")
-    def test_health_check_unhealthy(self, mock_api_operations_class, client):
+    def test_health_check_unhealthy(self, app_api_ops, client):
         """Test unhealthy health check"""
         # Setup mock
-        mock_api_operations = Mock()
-        mock_api_operations.health_check.return_value = {
+        app_api_ops.health_check.return_value = {
             "status": "unhealthy",
             "error": "Database connection failed",
             "database_connected": False,
             "timestamp": "2024-01-15T10:30:00",
         }
-        mock_api_operations_class.return_value = mock_api_operations
 
         # Make request
         response = client.get("/health")
@@ -69,13 +57,14 @@ class TestHealthEndpoint:
         assert data["database_connected"] is False
         assert "error" in data
 
-    @patch("api.app.APIOperations")
-    def test_health_check_exception(self, mock_api_operations_class, client):
+    def test_health_check_exception(self, monkeypatch, client):
         """Test health check with exception"""
-        # Setup mock to raise exception
-        mock_api_operations_class.side_effect = Exception(
-            "Failed to initialize database operations"
-        )
+
+        # Make database operations fail to initialize
+        def failing_api_operations():
+            raise Exception("Failed to initialize database operations")
+
+        monkeypatch.setattr("api.app.APIOperations", failing_api_operations)
 
         # Make request
         response = client.get("/health")
@@ -110,39 +99,6 @@ class TestRootEndpoint:
 class TestGlobalErrorHandling:
     """Test suite for global error handling"""
 
-    def test_unhandled_exception_handling(self, client, mock_api_operations):
-        """Test global exception handler for unhandled errors"""
-        # Setup mock to return invalid format that will cause unpacking error
-        mock_api_operations.get_articles_paginated.return_value = "not a tuple"
-
-        # Make request that triggers the exception
-        response = client.get("/api/v1/articles")
-
-        # Assertions
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-
-        # Route-specific error message, not global handler
-        assert "error" in data
-        assert "Failed to retrieve articles" in data["error"]
-        assert "timestamp" in data
-
-    def test_http_exception_handling(self, client, mock_api_operations):
-        """Test HTTP exception handler"""
-        # Setup mock to raise HTTP exception
-        mock_api_operations.get_article_by_id.return_value = None
-
-        # Make request that triggers 404
-        response = client.get("/api/v1/articles/999")
-
-        # Assertions
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        data = response.json()
-
-        assert "error" in data
-        assert "Article with ID 999 not found" in data["error"]
-        assert "timestamp" in data
-
     def test_validation_error_handling(self, client):
         """Test validation error handling"""
         # Make request with invalid parameters
@@ -155,110 +111,114 @@ class TestGlobalErrorHandling:
         # FastAPI's default validation error format
         assert "detail" in data
 
-    def test_method_not_allowed(self, client):
-        """Test method not allowed error"""
-        response = client.post("/api/v1/articles")  # POST not allowed
-
-        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
-
-    def test_endpoint_not_found(self, client):
-        """Test 404 for non-existent endpoints"""
-        response = client.get("/api/v1/nonexistent")
+    @pytest.mark.parametrize(
+        "method,path,expected",
+        [
+            # POST not allowed
+            ("post", "/api/v1/articles", status.HTTP_405_METHOD_NOT_ALLOWED),
+            # Non-existent endpoint
+            ("get", "/api/v1/nonexistent", status.HTTP_404_NOT_FOUND),
+        ],
+    )
+    def test_routing_errors(self, client, method, path, expected):
+        """Test method not allowed and not found errors"""
+        response = getattr(client, method)(path)
 
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.status_code == expected
 
 
 class TestDatabaseErrorHandling:
-    """Test suite for database-related error handling"""
-
-    def test_database_connection_error(self, client, mock_api_operations):
-        """Test database connection error handling"""
-        # Setup mock to raise database connection error
-        mock_api_operations.get_articles_paginated.side_effect = Exception(
-            "Connection to database failed"
-        )
-
-        # Make request
-        response = client.get("/api/v1/articles")
-
-        # Assertions
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-
-        assert "error" in data
-        assert "Failed to retrieve articles" in data["error"]
-
-    def test_database_timeout_error(self, client, mock_api_operations):
-        """Test database timeout error handling"""
-        # Setup mock to raise timeout error
-        mock_api_operations.search_articles.side_effect = Exception(
-            "Query timeout exceeded"
-        )
-
-        # Make request
-        response = client.get("/api/v1/articles/search?query=test")
-
-        # Assertions
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-
-        assert "error" in data
-        assert "Search failed" in data["error"]
-
-    def test_source_not_found_error(self, client, mock_api_operations):
-        """Test source not found error handling"""
-        # Setup mock
-        mock_api_operations.get_sources_with_stats.return_value = [
-            {
-                "name": "BBC News",
-                "article_count": 10,
-                "processed_count": 8,
-                "latest_article": "2024-01-20T15:30:00",
-            }
-        ]
-
-        # Make request for non-existent source
-        response = client.get("/api/v1/sources/Nonexistent Source/articles")
-
-        # Assertions
-        assert response.status_code == status.HTTP_404_NOT_FOUND
+    """Test suite for database-related and route error handling"""
+
+    @pytest.mark.parametrize(
+        "method,setup,url,expected_status,expected_error",
+        [
+            # Invalid return format causes an unpacking error in the route
+            (
+                "get_articles_paginated",
+                {"return_value": "not a tuple"},
+                "/api/v1/articles",
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Failed to retrieve articles",
+            ),
+            (
+                "get_article_by_id",
+                {"return_value": None},
+                "/api/v1/articles/999",
+                status.HTTP_404_NOT_FOUND,
+                "Article with ID 999 not found",
+            ),
+            (
+                "get_articles_paginated",
+                {"side_effect": Exception("Connection to database failed")},
+                "/api/v1/articles",
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Failed to retrieve articles",
+            ),
+            (
+                "search_articles",
+                {"side_effect": Exception("Query timeout exceeded")},
+                "/api/v1/articles/search?query=test",
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Search failed",
+            ),
+            (
+                "get_sources_with_stats",
+                {
+                    "return_value": [
+                        {
+                            "name": "BBC News",
+                            "article_count": 10,
+                            "processed_count": 8,
+                            "latest_article": "2024-01-20T15:30:00",
+                        }
+                    ]
+                },
+                "/api/v1/sources/Nonexistent Source/articles",
+                status.HTTP_404_NOT_FOUND,
+                "Source 'Nonexistent Source' not found",
+            ),
+        ],
+    )
+    def test_route_errors(
+        self,
+        client,
+        mock_api_operations,
+        method,
+        setup,
+        url,
+        expected_status,
+        expected_error,
+    ):
+        """Test route error responses for failing or missing data"""
+        getattr(mock_api_operations, method).configure_mock(**setup)
+
+        response = client.get(url)
+
+        assert response.status_code == expected_status
         data = response.json()
 
-        assert "error" in data
-        assert "Source 'Nonexistent Source' not found" in data["error"]
+        assert expected_error in data["error"]
+        assert "timestamp" in data
 
 
 class TestParameterValidation:
     """Test suite for parameter validation errors"""
 
-    def test_search_query_too_short(self, client):
-        """Test search query validation"""
-        response = client.get("/api/v1/articles/search?query=a")
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_pagination_validation(self, client):
-        """Test pagination parameter validation"""
-        # Page too low
-        response = client.get("/api/v1/articles?page=0")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-        # Per_page too high
-        response = client.get("/api/v1/articles?per_page=101")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-        # Per_page too low
-        response = client.get("/api/v1/articles?per_page=0")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    def test_recent_articles_validation(self, client):
-        """Test recent articles parameter validation"""
-        # Hours too high
-        response = client.get("/api/v1/articles/recent?hours=200")
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-        # Limit too high
-        response = client.get("/api/v1/articles/recent?limit=150")
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/v1/articles/search?query=a",  # Search query too short
+            "/api/v1/articles?page=0",  # Page too low
+            "/api/v1/articles?per_page=101",  # Per_page too high
+            "/api/v1/articles?per_page=0",  # Per_page too low
+            "/api/v1/articles/recent?hours=200",  # Hours too high
+            "/api/v1/articles/recent?limit=150",  # Limit too high
+        ],
+    )
+    def test_query_parameter_validation(self, client, url):
+        """Test search, pagination and recent articles parameter validation"""
+        response = client.get(url)
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
     def test_invalid_article_id(self, client, mock_api_operations):
@@ -280,25 +240,19 @@ class TestParameterValidation:
 class TestCORSHandling:
     """Test suite for CORS handling"""
 
-    def test_cors_preflight(self, client):
-        """Test CORS preflight request"""
-        response = client.options(
+    def test_cors_behavior(self, client):
+        """Test CORS preflight and CORS headers on a normal response"""
+        origin = {"Origin": "https://example.com"}
+        preflight = client.options(
             "/api/v1/articles",
             headers={
-                "Origin": "https://example.com",
+                **origin,
                 "Access-Control-Request-Method": "GET",
                 "Access-Control-Request-Headers": "Content-Type",
             },
         )
+        response = client.get("/api/v1/sources", headers=origin)
 
         # Should allow CORS
-        assert response.status_code in [status.HTTP_200_OK, status.HTTP_204_NO_CONTENT]
-
-    def test_cors_headers_present(self, client):
-        """Test that CORS headers are present in responses"""
-        response = client.get(
-            "/api/v1/sources", headers={"Origin": "https://example.com"}
-        )
-
-        # Check for CORS headers
+        assert preflight.status_code in [status.HTTP_200_OK, status.HTTP_204_NO_CONTENT]
         assert "access-control-allow-origin" in response.headers
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for the whole test suite
+"""
+
+import pytest
+
+from config import Config
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture
+def mock_config(monkeypatch):
+    """Pin the Config values the news sources read; tests may reassign them
+
+    Every source module imports the same Config class, so patching it here
+    covers them all. monkeypatch restores the real values afterwards, even
+    when a test assigns mock_config.KEYWORDS directly.
+    """
+    monkeypatch.setattr(Config, "KEYWORDS", ("stockport",))
+    monkeypatch.setattr(Config, "HTTP_TIMEOUT", None)
+    return Config
@@ -3,17 +3,54 @@
 Comprehensive test suite for AISummarizer class
 """
 
-import os
-import sys
+from types import SimpleNamespace
 from unittest.mock import ANY, Mock, patch
 
-import openai
 import pytest
 
-# Add src to path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))  # noqa
+from processors.ai_summarizer import AISummarizer
 
-from processors.ai_summarizer import AISummarizer  # noqa
+
+def make_openai_response(content):
+    """Build a stand-in OpenAI chat completion response carrying ``content``"""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+
+
+MOCK_OPENAI_RESPONSE = make_openai_response(
+    "Stockport Council's investing £2.5m in local parks, upgrading playgrounds and creating community gardens. Work starts in March, finishing by year-end. Residents are chuffed after campaigning for better facilities."
+)
+TEST_SUMMARY_RESPONSE = make_openai_response("Test summary")
+SYSTEM_PROMPT = (
+    "You summarise the user-provided text. Output the summary only, no preamble "
+    "or follow-up questions. ≤200 words, shorter if clear. Informal, friendly, "
+    "polite. Subtle Manchester UK vibe in phrasing. Professional, unbiased, UK "
+    "spelling."
+)
+
+SHORT_CONTENT = "Stockport library will be closed for maintenance next week."
+LONG_CONTENT = "Stockport Council confirms new opening hours for the library. " * 20
+
+
+@pytest.fixture(scope="module")
+def _shared_summarizer():
+    """AISummarizer built once per module against a patched OpenAI client"""
+    patcher = patch("openai.OpenAI")
+    mock_openai = patcher.start()
+    mock_client = Mock()
+    mock_openai.return_value = mock_client
+    summarizer = AISummarizer()
+    yield summarizer, mock_client
+    patcher.stop()
+
+
+@pytest.fixture
+def summarizer_with_mock(_shared_summarizer):
+    """Shared summarizer and its mock client, reset for each test"""
+    summarizer, mock_client = _shared_summarizer
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    return summarizer, mock_client
 
 
 class TestAISummarizer:
@@ -34,27 +71,6 @@ class TestAISummarizer:
             "welcomed the news, with many having campaigned for better facilities for months."
         )
 
-    @pytest.fixture
-    def short_content(self):
-        """Fixture providing short content that doesn't need truncation"""
-        return "Stockport library will be closed for maintenance next week."
-
-    @pytest.fixture
-    def long_content(self):
-        """Fixture providing long content for fallback testing"""
-        return "A" * 300  # 300 characters of 'A'
-
-    @pytest.fixture
-    def mock_openai_response(self):
-        """Fixture providing a mock OpenAI API response"""
-        mock_response = Mock()
-        mock_choice = Mock()
-        mock_message = Mock()
-        mock_message.content = "Stockport Council's investing £2.5m in local parks, upgrading playgrounds and creating community gardens. Work starts in March, finishing by year-end. Residents are chuffed after campaigning for better facilities."
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
-        return mock_response
-
     def test_initialization_success(self):
         """Test AISummarizer initializes correctly"""
         with patch("openai.OpenAI") as mock_openai:
@@ -76,205 +92,77 @@ class TestAISummarizer:
             # Verify OpenAI client was created
             mock_openai.assert_called_once_with(api_key="test-api-key-123")
 
-    def test_summarize_success(self, sample_content, mock_openai_response):
+    def test_summarize_success(self, summarizer_with_mock, sample_content):
         """Test successful summarization with OpenAI API"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_client.chat.completions.create.return_value = mock_openai_response
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer()
-            result = summarizer.summarize(sample_content)
-
-            # Verify the result
-            assert result == mock_openai_response.choices[0].message.content
-            assert "Stockport Council" in result
-            assert "£2.5m" in result
-
-            # Verify API was called correctly
-            mock_client.chat.completions.create.assert_called_once_with(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You summarise the user-provided text. Output the summary only, no preamble or follow-up questions. ≤200 words, shorter if clear. Informal, friendly, polite. Subtle Manchester UK vibe in phrasing. Professional, unbiased, UK spelling.",
-                    },
-                    {"role": "user", "content": sample_content},
-                ],
-                max_tokens=250,
-            )
-
-    def test_summarize_api_error_fallback(self, sample_content):
-        """Test fallback behavior when OpenAI API fails"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_client.chat.completions.create.side_effect = Exception("API Error")
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer()
-
-            with patch("logging.error") as mock_logging:
-                result = summarizer.summarize(sample_content)
-
-                # Verify fallback behavior (truncate to 200 chars + "...")
-                expected_fallback = sample_content[:200] + "..."
-                assert result == expected_fallback
-
-                # Verify error was logged
-                mock_logging.assert_called_once()
-                assert "AI summarization error" in mock_logging.call_args[0][0]
-
-    def test_summarize_short_content_fallback(self, short_content):
-        """Test fallback with short content (no truncation)"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_client.chat.completions.create.side_effect = Exception("API Error")
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer()
-            result = summarizer.summarize(short_content)
-
-            # Short content should be returned as-is (no "...")
-            assert result == short_content
-            assert not result.endswith("...")
-
-    def test_summarize_long_content_fallback(self, long_content):
-        """Test fallback with content longer than 200 characters"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_client.chat.completions.create.side_effect = Exception("API Error")
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer()
-            result = summarizer.summarize(long_content)
-
-            # Long content should be truncated to 200 chars + "..."
-            assert len(result) == 203  # 200 + "..."
-            assert result == "A" * 200 + "..."
-            assert result.endswith("...")
-
-    def test_summarize_empty_content(self):
-        """Test summarization with empty content"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_client.chat.completions.create.side_effect = Exception("API Error")
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer()
-            result = summarizer.summarize("")
-
-            # Empty content should return empty string
-            assert result == ""
-
-    def test_summarize_whitespace_content(self):
-        """Test summarization with whitespace-only content"""
-        whitespace_content = "   \n\t   "
-
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_client.chat.completions.create.side_effect = Exception("API Error")
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer()
-            result = summarizer.summarize(whitespace_content)
-
-            # Whitespace content should be returned as-is
-            assert result == whitespace_content
-
-    def test_summarize_openai_authentication_error(self, sample_content):
-        """Test handling of OpenAI authentication errors"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            # Create a proper mock exception with required arguments
-            auth_error = Exception("Invalid API key - simulated AuthenticationError")
-            mock_client.chat.completions.create.side_effect = auth_error
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer()
-
-            with patch("logging.error") as mock_logging:
-                result = summarizer.summarize(sample_content)
-
-                # Should fall back to truncation
-                assert result.endswith("...")
-
-                # Should log the authentication error
-                mock_logging.assert_called_once()
-
-    def test_summarize_openai_rate_limit_error(self, sample_content):
-        """Test handling of OpenAI rate limit errors"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            # Create a proper mock exception with required arguments
-            rate_limit_error = Exception(
-                "Rate limit exceeded - simulated RateLimitError"
-            )
-            mock_client.chat.completions.create.side_effect = rate_limit_error
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer()
-
-            with patch("logging.error") as mock_logging:
-                result = summarizer.summarize(sample_content)
-
-                # Should fall back to truncation
-                assert result.endswith("...")
-
-                # Should log the rate limit error
-                mock_logging.assert_called_once()
-
-    def test_summarize_system_prompt_content(self):
+        summarizer, mock_client = summarizer_with_mock
+        mock_client.chat.completions.create.return_value = MOCK_OPENAI_RESPONSE
+
+        result = summarizer.summarize(sample_content)
+
+        # Verify the result
+        assert result == MOCK_OPENAI_RESPONSE.choices[0].message.content
+        assert "Stockport Council" in result
+        assert "£2.5m" in result
+
+        # Verify API was called once with the article as the user message;
+        # the prompt text itself is checked in test_summarize_system_prompt_content
+        mock_client.chat.completions.create.assert_called_once()
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["model"] == "gpt-4o-mini"
+        assert kwargs["max_tokens"] == 250
+        assert len(kwargs["messages"]) == 2
+        assert kwargs["messages"][1]["content"] is sample_content
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ("", ""),
+            ("   \n\t   ", "   \n\t   "),
+            (SHORT_CONTENT, SHORT_CONTENT),
+            ("A" * 300, "A" * 200 + "..."),
+            (LONG_CONTENT, LONG_CONTENT[:200] + "..."),
+        ],
+        ids=["empty", "whitespace", "short", "exact-truncation", "long"],
+    )
+    def test_summarize_fallback(self, summarizer_with_mock, content, expected):
+        """Test API failures fall back to the content truncated to 200 characters"""
+        summarizer, mock_client = summarizer_with_mock
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
+
+        assert summarizer.summarize(content) == expected
+
+    def test_summarize_system_prompt_content(self, summarizer_with_mock):
         """Test that the system prompt is correctly formatted"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_response = Mock()
-            mock_choice = Mock()
-            mock_message = Mock()
-            mock_message.content = "Test summary"
-            mock_choice.message = mock_message
-            mock_response.choices = [mock_choice]
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
+        summarizer, mock_client = summarizer_with_mock
+        mock_client.chat.completions.create.return_value = TEST_SUMMARY_RESPONSE
 
-            summarizer = AISummarizer()
-            summarizer.summarize("Test content")
+        summarizer.summarize("Test content")
 
-            # Get the call arguments
-            call_args = mock_client.chat.completions.create.call_args
-            messages = call_args[1]["messages"]
+        # Get the call arguments
+        call_args = mock_client.chat.completions.create.call_args
+        messages = call_args[1]["messages"]
 
-            # Verify system message
-            system_message = messages[0]
-            assert system_message["role"] == "system"
-            assert "Manchester UK vibe" in system_message["content"]
-            assert "≤200 words" in system_message["content"]
-            assert "UK spelling" in system_message["content"]
+        # Verify system message
+        system_message = messages[0]
+        assert system_message["role"] == "system"
+        assert system_message["content"] == SYSTEM_PROMPT
 
-            # Verify user message
-            user_message = messages[1]
-            assert user_message["role"] == "user"
-            assert user_message["content"] == "Test content"
+        # Verify user message
+        user_message = messages[1]
+        assert user_message["role"] == "user"
+        assert user_message["content"] == "Test content"
 
-    def test_summarize_model_and_parameters(self):
+    def test_summarize_model_and_parameters(self, summarizer_with_mock):
         """Test that correct model and parameters are used"""
-        with patch("openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_response = Mock()
-            mock_choice = Mock()
-            mock_message = Mock()
-            mock_message.content = "Test summary"
-            mock_choice.message = mock_message
-            mock_response.choices = [mock_choice]
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
+        summarizer, mock_client = summarizer_with_mock
+        mock_client.chat.completions.create.return_value = TEST_SUMMARY_RESPONSE
 
-            summarizer = AISummarizer()
-            summarizer.summarize("Test content")
+        summarizer.summarize("Test content")
 
-            # Verify API call parameters
-            mock_client.chat.completions.create.assert_called_once_with(
-                model="gpt-4o-mini", messages=ANY, max_tokens=250
-            )
+        # Verify API call parameters
+        mock_client.chat.completions.create.assert_called_once_with(
+            model="gpt-4o-mini", messages=ANY, max_tokens=250
+        )
 
 
 class TestAISummarizerIntegration:
@@ -295,41 +183,22 @@ class TestAISummarizerIntegration:
         # assert len(result) <= 250  # Rough check for max_tokens limit
         pass
 
-    def test_logging_behavior(self):
+    def test_logging_behavior(self, summarizer_with_mock):
         """Test that logging works correctly for both success and error cases"""
-        # Test successful logging
-        with patch("openai.OpenAI") as mock_openai, patch("logging.info") as mock_info:
-
-            mock_client = Mock()
-            mock_response = Mock()
-            mock_choice = Mock()
-            mock_message = Mock()
-            mock_message.content = "Test summary"
-            mock_choice.message = mock_message
-            mock_response.choices = [mock_choice]
-            mock_client.chat.completions.create.return_value = mock_response
-            mock_openai.return_value = mock_client
+        summarizer, mock_client = summarizer_with_mock
 
-            sample_content = "Test content for logging behavior"
-            summarizer = AISummarizer()
-            summarizer.summarize(sample_content)
+        # Test successful logging
+        mock_client.chat.completions.create.return_value = TEST_SUMMARY_RESPONSE
+        with patch("logging.info") as mock_info:
+            summarizer.summarize("Test content for logging behavior")
 
             # Verify success logging
             mock_info.assert_called_once_with("AI summary generated")
 
         # Test error logging
-        with (
-            patch("openai.OpenAI") as mock_openai,
-            patch("logging.error") as mock_error,
-        ):
-
-            mock_client = Mock()
-            mock_client.chat.completions.create.side_effect = Exception("Test error")
-            mock_openai.return_value = mock_client
-
-            sample_content = "Test content for error logging"
-            summarizer = AISummarizer()
-            summarizer.summarize(sample_content)
+        mock_client.chat.completions.create.side_effect = Exception("Test error")
+        with patch("logging.error") as mock_error:
+            summarizer.summarize("Test content for error logging")
 
             # Verify error logging
             mock_error.assert_called_once()
@@ -3,6 +3,7 @@
 Comprehensive test suite for BaseNewsSource class
 """
 
+import importlib
 import os
 import sys
 from abc import ABC
@@ -16,6 +17,21 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))  # noqa
 from sources.base_source import BaseNewsSource  # noqa
 
 
+class _EmptyTestSource(BaseNewsSource):
+    """Minimal concrete source for exercising the base class helpers"""
+
+    __slots__ = ()
+
+    def fetch_articles(self) -> List[Dict]:
+        return []
+
+
+@pytest.fixture(scope="module")
+def source():
+    """One concrete source shared by every test in the module"""
+    return _EmptyTestSource("Test Source")
+
+
 class TestBaseNewsSource:
     """Test suite for BaseNewsSource abstract class"""
 
@@ -55,352 +71,312 @@ class TestBaseNewsSource:
         with pytest.raises(TypeError, match="Can't instantiate abstract class"):
             IncompleteNewsSource("Incomplete Source")
 
+    @pytest.mark.parametrize(
+        "module,class_name",
+        [
+            ("sources.bbc_source", "BBCSource"),
+            ("sources.men_source", "MENSource"),
+            ("sources.nub_source", "NubSource"),
+            ("sources.onestockport_source", "OneStockportSource"),
+            ("sources.stockportcouncil_source", "StockportCouncilSource"),
+            ("sources.totallystockport_source", "TotallyStockportSource"),
+        ],
+    )
+    def test_concrete_sources_have_no_instance_dict(self, module, class_name):
+        """Test that every shipped source keeps its attributes in __slots__"""
+        source_class = getattr(importlib.import_module(module), class_name)
+
+        assert not hasattr(source_class(), "__dict__")
+
     def test_source_name_initialization(self):
         """Test that source_name is properly set during initialization"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("My Test Source")
+        source = _EmptyTestSource("My Test Source")
         assert source.source_name == "My Test Source"
+        # Fully slotted subclasses carry no per-instance __dict__
+        assert not hasattr(source, "__dict__")
+
+    @pytest.mark.parametrize(
+        "articles,keywords,expected_titles",
+        [
+            pytest.param(
+                [
+                    {
+                        "original_title": "Stockport Council Meeting",
+                        "original_summary": "Local government news",
+                    },
+                    {
+                        "original_title": "Manchester United News",
+                        "original_summary": "Football update",
+                    },
+                    {
+                        "original_title": "Weather Update",
+                        "original_summary": "Rain expected in Stockport",
+                    },
+                    {
+                        "original_title": "London News",
+                        "original_summary": "Capital city updates",
+                    },
+                ],
+                ["stockport", "manchester"],
+                [
+                    "Stockport Council Meeting",
+                    "Manchester United News",
+                    "Weather Update",
+                ],
+                id="basic",
+            ),
+            pytest.param(
+                [
+                    {
+                        "original_title": "STOCKPORT NEWS",
+                        "original_summary": "Capital case title",
+                    },
+                    {
+                        "original_title": "local news",
+                        "original_summary": "News about MACCLESFIELD",
+                    },
+                    {
+                        "original_title": "Mixed Case",
+                        "original_summary": "Story about Buxton",
+                    },
+                ],
+                ["stockport", "macclesfield", "buxton"],
+                ["STOCKPORT NEWS", "local news", "Mixed Case"],
+                id="case-insensitive",
+            ),
+            pytest.param(
+                [
+                    {
+                        "original_title": "Local Council News",
+                        "original_summary": "Meeting in Stockport today",
+                    },
+                    {
+                        "original_title": "Stockport Events",
+                        "original_summary": "Various local activities",
+                    },
+                    {
+                        "original_title": "National News",
+                        "original_summary": "Nothing local here",
+                    },
+                    {
+                        "original_title": "Weather",
+                        "original_summary": "Macclesfield will see rain",
+                    },
+                ],
+                ["stockport", "macclesfield"],
+                # First matches in summary, second in title, fourth in summary
+                ["Local Council News", "Stockport Events", "Weather"],
+                id="title-and-summary",
+            ),
+            pytest.param([], ["stockport", "manchester"], [], id="no-articles"),
+            pytest.param(
+                [
+                    {
+                        "original_title": "Stockport News",
+                        "original_summary": "Local update",
+                    },
+                    {
+                        "original_title": "Manchester News",
+                        "original_summary": "City update",
+                    },
+                ],
+                [],
+                [],
+                id="no-keywords",
+            ),
+            pytest.param(
+                [
+                    {
+                        "original_title": "London News",
+                        "original_summary": "Capital updates",
+                    },
+                    {
+                        "original_title": "Birmingham News",
+                        "original_summary": "Midlands update",
+                    },
+                ],
+                ["stockport", "manchester"],
+                [],
+                id="no-matches",
+            ),
+            pytest.param(
+                [
+                    {"original_summary": "Article about Stockport"},
+                    {
+                        "original_title": "Manchester News",
+                        "original_summary": "City update",
+                    },
+                    {},
+                ],
+                ["stockport", "manchester"],
+                [None, "Manchester News"],
+                id="missing-title",
+            ),
+            pytest.param(
+                [
+                    {"original_title": "Stockport Council Meeting"},
+                    {
+                        "original_title": "London News",
+                        "original_summary": "Capital updates",
+                    },
+                    {"original_title": "Weather News"},
+                ],
+                ["stockport"],
+                ["Stockport Council Meeting"],
+                id="missing-summary",
+            ),
+            pytest.param(
+                [
+                    {
+                        "original_title": "Greater Manchester News",
+                        "original_summary": "Regional update",
+                    },
+                    {
+                        "original_title": "Stockport-based Company",
+                        "original_summary": "Business news",
+                    },
+                    {
+                        "original_title": "Local News",
+                        "original_summary": "About New Macclesfield development",
+                    },
+                ],
+                ["manchester", "stockport", "macclesfield"],
+                ["Greater Manchester News", "Stockport-based Company", "Local News"],
+                id="partial-words",
+            ),
+            pytest.param(
+                [
+                    {
+                        "original_title": "Stockport's New Initiative",
+                        "original_summary": "Local program",
+                    },
+                    {
+                        "original_title": "Manchester United F.C.",
+                        "original_summary": "Football club news",
+                    },
+                    {
+                        "original_title": "High Peak & District",
+                        "original_summary": "Regional coverage",
+                    },
+                ],
+                ["stockport", "manchester", "high peak"],
+                [
+                    "Stockport's New Initiative",
+                    "Manchester United F.C.",
+                    "High Peak & District",
+                ],
+                id="special-characters",
+            ),
+            pytest.param(
+                [
+                    {
+                        "original_title": "Stockport café opens",
+                        "original_summary": "New business",
+                    },
+                    {
+                        "original_title": "Manchester événement",
+                        "original_summary": "Cultural event",
+                    },
+                    {
+                        "original_title": "Regular news",
+                        "original_summary": "Nothing special",
+                    },
+                ],
+                ["stockport", "manchester"],
+                ["Stockport café opens", "Manchester événement"],
+                id="unicode",
+            ),
+        ],
+    )
+    def test_filter_articles(self, source, articles, keywords, expected_titles):
+        """Test which articles filter_articles keeps, in their original order"""
+        filtered = source.filter_articles(articles, keywords)
 
-    def test_filter_articles_basic_filtering(self):
-        """Test basic article filtering functionality"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
+        assert [a.get("original_title") for a in filtered] == expected_titles
 
+    def test_filter_articles_preserves_original_data(self, source):
+        """Test that filtering preserves all original article data"""
         articles = [
             {
                 "original_title": "Stockport Council Meeting",
                 "original_summary": "Local government news",
-            },
-            {
-                "original_title": "Manchester United News",
-                "original_summary": "Football update",
-            },
-            {
-                "original_title": "Weather Update",
-                "original_summary": "Rain expected in Stockport",
-            },
-            {
-                "original_title": "London News",
-                "original_summary": "Capital city updates",
-            },
-        ]
-
-        keywords = ["stockport", "manchester"]
-        filtered = source.filter_articles(articles, keywords)
-
-        assert len(filtered) == 3
-        assert filtered[0]["original_title"] == "Stockport Council Meeting"
-        assert filtered[1]["original_title"] == "Manchester United News"
-        assert filtered[2]["original_title"] == "Weather Update"
-
-    def test_filter_articles_case_insensitive(self):
-        """Test that filtering is case insensitive"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        articles = [
-            {
-                "original_title": "STOCKPORT NEWS",
-                "original_summary": "Capital case title",
-            },
-            {
-                "original_title": "local news",
-                "original_summary": "News about MACCLESFIELD",
-            },
-            {"original_title": "Mixed Case", "original_summary": "Story about Buxton"},
-        ]
-
-        keywords = ["stockport", "macclesfield", "buxton"]
-        filtered = source.filter_articles(articles, keywords)
-
-        assert len(filtered) == 3
-
-    def test_filter_articles_title_and_summary_matching(self):
-        """Test that filtering works on both title and summary"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        articles = [
-            {
-                "original_title": "Local Council News",
-                "original_summary": "Meeting in Stockport today",
-            },
-            {
-                "original_title": "Stockport Events",
-                "original_summary": "Various local activities",
-            },
-            {
-                "original_title": "National News",
-                "original_summary": "Nothing local here",
-            },
-            {
-                "original_title": "Weather",
-                "original_summary": "Macclesfield will see rain",
-            },
-        ]
-
-        keywords = ["stockport", "macclesfield"]
-        filtered = source.filter_articles(articles, keywords)
-
-        assert len(filtered) == 3
-        # First matches in summary, second in title, fourth in summary
-        assert "Local Council News" in [a["original_title"] for a in filtered]
-        assert "Stockport Events" in [a["original_title"] for a in filtered]
-        assert "Weather" in [a["original_title"] for a in filtered]
-
-    def test_filter_articles_empty_articles_list(self):
-        """Test filtering with empty articles list"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        filtered = source.filter_articles([], ["stockport", "manchester"])
-        assert filtered == []
-
-    def test_filter_articles_empty_keywords_list(self):
-        """Test filtering with empty keywords list"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        articles = [
-            {"original_title": "Stockport News", "original_summary": "Local update"},
-            {"original_title": "Manchester News", "original_summary": "City update"},
-        ]
-
-        filtered = source.filter_articles(articles, [])
-        assert filtered == []
-
-    def test_filter_articles_no_matching_keywords(self):
-        """Test filtering when no articles match keywords"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        articles = [
-            {"original_title": "London News", "original_summary": "Capital updates"},
-            {
-                "original_title": "Birmingham News",
-                "original_summary": "Midlands update",
-            },
-        ]
-
-        keywords = ["stockport", "manchester"]
-        filtered = source.filter_articles(articles, keywords)
-        assert filtered == []
-
-    def test_filter_articles_missing_title_field(self):
-        """Test filtering with articles missing original_title field"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        articles = [
-            {"original_summary": "Article about Stockport"},  # Missing title
-            {"original_title": "Manchester News", "original_summary": "City update"},
-            {},  # Missing both title and summary
-        ]
-
-        keywords = ["stockport", "manchester"]
-        filtered = source.filter_articles(articles, keywords)
-
-        # Should match first article by summary and second by title
-        assert len(filtered) == 2
-
-    def test_filter_articles_missing_summary_field(self):
-        """Test filtering with articles missing original_summary field"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        articles = [
-            {"original_title": "Stockport Council Meeting"},  # Missing summary
-            {"original_title": "London News", "original_summary": "Capital updates"},
-            {"original_title": "Weather News"},  # Missing summary
+                "original_link": "https://example.com/stockport-news",
+                "original_source": "Test News",
+                "extra_field": "should be preserved",
+            }
         ]
 
         keywords = ["stockport"]
         filtered = source.filter_articles(articles, keywords)
 
-        # Should match first article by title only
         assert len(filtered) == 1
-        assert filtered[0]["original_title"] == "Stockport Council Meeting"
-
-    def test_filter_articles_partial_keyword_matching(self):
-        """Test that partial keyword matching works"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        articles = [
-            {
-                "original_title": "Greater Manchester News",
-                "original_summary": "Regional update",
-            },
-            {
-                "original_title": "Stockport-based Company",
-                "original_summary": "Business news",
-            },
-            {
-                "original_title": "Local News",
-                "original_summary": "About New Macclesfield development",
-            },
-        ]
-
-        keywords = ["manchester", "stockport", "macclesfield"]
-        filtered = source.filter_articles(articles, keywords)
+        assert filtered[0]["original_link"] == "https://example.com/stockport-news"
+        assert filtered[0]["original_source"] == "Test News"
+        assert filtered[0]["extra_field"] == "should be preserved"
 
-        # All should match due to partial string matching
-        assert len(filtered) == 3
+    def test_iter_filtered_articles_is_lazy(self, source):
+        """Test that iter_filtered_articles yields matches without building a list"""
+        articles = iter(
+            [
+                {"original_title": "Stockport News", "original_summary": ""},
+                {"original_title": "London News", "original_summary": ""},
+                {"original_title": "Manchester News", "original_summary": ""},
+            ]
+        )
 
-    def test_filter_articles_special_characters_in_content(self):
-        """Test filtering with special characters in titles and summaries"""
+        matches = source.iter_filtered_articles(articles, ["stockport", "manchester"])
 
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
+        assert next(matches)["original_title"] == "Stockport News"
+        # Only the first article has been consumed so far
+        assert next(articles)["original_title"] == "London News"
+        assert [a["original_title"] for a in matches] == ["Manchester News"]
 
+    def test_filter_articles_performance_with_large_dataset(self, source):
+        """Test filtering performance with a large number of articles"""
+        # Create a large dataset; every 10th article contains the keyword
         articles = [
             {
-                "original_title": "Stockport's New Initiative",
-                "original_summary": "Local program",
-            },
-            {
-                "original_title": "Manchester United F.C.",
-                "original_summary": "Football club news",
-            },
-            {
-                "original_title": "High Peak & District",
-                "original_summary": "Regional coverage",
-            },
+                "original_title": (
+                    f"Article {i} about Stockport" if i % 10 == 0 else f"Article {i}"
+                ),
+                "original_summary": (
+                    f"Content {i}" if i % 10 == 0 else f"Content {i} without keywords"
+                ),
+            }
+            for i in range(1000)
         ]
 
-        keywords = ["stockport", "manchester", "high peak"]
+        keywords = ["stockport"]
         filtered = source.filter_articles(articles, keywords)
 
-        assert len(filtered) == 3
-
-    def test_filter_articles_unicode_characters(self):
-        """Test filtering with unicode characters"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
+        # Should find 100 articles (every 10th from 1000)
+        assert len(filtered) == 100
 
-        source = TestSource("Test Source")
+    def test_filter_articles_without_ahocorasick(self, source, monkeypatch):
+        """Test that filtering falls back to a compiled regex without pyahocorasick"""
+        monkeypatch.setattr("sources.base_source.ahocorasick", None)
+        monkeypatch.setattr(BaseNewsSource, "_keyword_matchers", {})
 
         articles = [
-            {
-                "original_title": "Stockport café opens",
-                "original_summary": "New business",
-            },
-            {
-                "original_title": "Manchester événement",
-                "original_summary": "Cultural event",
-            },
-            {"original_title": "Regular news", "original_summary": "Nothing special"},
+            {"original_title": "Stockport News", "original_summary": "Local update"},
+            {"original_title": "London News", "original_summary": "Capital updates"},
+            {"original_title": "Weather", "original_summary": "Rain in High Peak"},
+            {"original_title": "Budget", "original_summary": "Council spends 125m"},
         ]
 
-        keywords = ["stockport", "manchester"]
-        filtered = source.filter_articles(articles, keywords)
-
-        assert len(filtered) == 2
-
-    def test_filter_articles_preserves_original_data(self):
-        """Test that filtering preserves all original article data"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
+        # Keywords are escaped, so "1.5m" must not match "125m" as a regex
+        filtered = source.filter_articles(articles, ["stockport", "high peak", "1.5m"])
 
-        source = TestSource("Test Source")
+        assert [a["original_title"] for a in filtered] == ["Stockport News", "Weather"]
+        assert source.filter_articles(articles, []) == []
 
+    def test_filter_articles_keyword_does_not_span_fields(self, source):
+        """Test that a keyword split across title and summary does not match"""
         articles = [
-            {
-                "original_title": "Stockport Council Meeting",
-                "original_summary": "Local government news",
-                "original_link": "https://example.com/stockport-news",
-                "original_source": "Test News",
-                "extra_field": "should be preserved",
-            }
+            {"original_title": "Walk up High", "original_summary": "Peak views"}
         ]
 
-        keywords = ["stockport"]
-        filtered = source.filter_articles(articles, keywords)
-
-        assert len(filtered) == 1
-        assert filtered[0]["original_link"] == "https://example.com/stockport-news"
-        assert filtered[0]["original_source"] == "Test News"
-        assert filtered[0]["extra_field"] == "should be preserved"
-
-    def test_filter_articles_performance_with_large_dataset(self):
-        """Test filtering performance with a large number of articles"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
-        # Create a large dataset
-        articles = []
-        for i in range(1000):
-            if i % 10 == 0:  # Every 10th article contains keyword
-                articles.append(
-                    {
-                        "original_title": f"Article {i} about Stockport",
-                        "original_summary": f"Content {i}",
-                    }
-                )
-            else:
-                articles.append(
-                    {
-                        "original_title": f"Article {i}",
-                        "original_summary": f"Content {i} without keywords",
-                    }
-                )
-
-        keywords = ["stockport"]
-        filtered = source.filter_articles(articles, keywords)
-
-        # Should find 100 articles (every 10th from 1000)
-        assert len(filtered) == 100
+        assert source.filter_articles(articles, ["high peak"]) == []
 
 
 class TestBaseNewsSourceIntegration:
@@ -444,21 +420,15 @@ class TestBaseNewsSourceIntegration:
         assert source.source_name == "Mock Local News"
 
         # Verify the correct articles are returned
-        titles = [article["original_title"] for article in articles]
-        assert "Stockport Market Reopens" in titles
-        assert "Manchester Airport Expansion" in titles
-        assert "Weather Update" in titles
-        assert "London Stock Exchange" not in titles
-
-    def test_multiple_keyword_sets(self):
+        titles = {article["original_title"] for article in articles}
+        assert titles == {
+            "Stockport Market Reopens",
+            "Manchester Airport Expansion",
+            "Weather Update",
+        }
+
+    def test_multiple_keyword_sets(self, source):
         """Test filtering with different keyword sets"""
-
-        class TestSource(BaseNewsSource):
-            def fetch_articles(self) -> List[Dict]:
-                return []
-
-        source = TestSource("Test Source")
-
         articles = [
             {
                 "original_title": "Stockport Council Budget",
@@ -3,44 +3,107 @@
 Comprehensive test suite for BBCSource class
 """
 
-import os
-import sys
+import logging
 from datetime import datetime
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-# Removed SimpleNamespace import, using Mock instead
-
-# Add src to path so we can import our modules
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+import pytest
 
 from sources.base_source import BaseNewsSource
 from sources.bbc_source import BBCSource
 
+# Keyword sets shared by several tests; read-only like Config.KEYWORDS
+LOCAL_KEYWORDS = ("stockport", "manchester", "macclesfield")
+STOCKPORT_KEYWORDS = ("stockport",)
+
+# Expected pubdate for entries published at (2024, 3, 15, 10, 30, 0)
+PUBDATE_1030 = datetime(2024, 3, 15, 10, 30, 0)
+
+# Local news that the complete workflow should include
+LOCAL_ENTRIES = (
+    (
+        "Stockport Market renovation begins",
+        "Construction work starts on historic market",
+    ),
+    (
+        "Manchester Airport expansion approved",
+        "Runway development gets green light",
+    ),
+    (
+        "Macclesfield festival cancelled",
+        "Annual event postponed due to weather",
+    ),
+    (
+        "High Peak hiking trails closed",
+        "Safety concerns prompt temporary closure",
+    ),
+    (
+        "Buxton Opera House reopens",
+        "Venue welcomes back audiences after refurbishment",
+    ),
+)
+
+# Non-local news that the complete workflow should exclude
+NON_LOCAL_ENTRIES = (
+    ("London Stock Market rises", "Financial markets show positive movement"),
+    ("Birmingham traffic delays", "City center construction causes disruption"),
+    ("Liverpool FC transfer news", "Football club confirms new signing"),
+)
 
-def create_mock_rss_entry(title, link, summary=None, published_parsed=None):
-    """Helper function to create properly mocked RSS entries"""
-    entry = Mock()
-    entry.title = title
-    entry.link = link
 
-    # Mock the .get() method for summary - this handles entry.get('summary', '')
-    def get_method(key, default=""):
-        if key == "summary":
-            return summary if summary is not None else default
-        return default
+def create_mock_rss_entry(title, link, summary=None, published_parsed=None):
+    """Helper function to create lightweight stand-ins for feedparser entries"""
+    entry = SimpleNamespace(title=title, link=link)
 
-    entry.get = Mock(side_effect=get_method)
+    # Plain dict lookup handles entry.get('summary', '')
+    entry.get = {"summary": summary if summary is not None else ""}.get
 
-    # Set published_parsed if provided
+    # Leave published_parsed unset so hasattr returns False when it is absent
     if published_parsed is not None:
         entry.published_parsed = published_parsed
-    else:
-        # Ensure hasattr returns False when no published_parsed
-        del entry.published_parsed
 
     return entry
 
 
+@pytest.fixture
+def mock_feedparser(monkeypatch):
+    """Stand-in for feedparser.parse, reset for every test"""
+    parse = Mock()
+    monkeypatch.setattr("sources.bbc_source.feedparser.parse", parse)
+    return parse
+
+
+@pytest.fixture(scope="module")
+def bbc_source():
+    """One BBCSource shared by every test in the module"""
+    return BBCSource()
+
+
+@pytest.fixture(scope="session")
+def complete_workflow_entries():
+    """Realistic feed entries, built once; fetch_articles only reads them"""
+    local = [
+        create_mock_rss_entry(
+            title,
+            f"https://www.bbc.com/news/local-{i}",
+            summary,
+            (2024, 3, i + 1, 10 + i, 0, 0),
+        )
+        for i, (title, summary) in enumerate(LOCAL_ENTRIES)
+    ]
+    non_local = [
+        create_mock_rss_entry(
+            title,
+            f"https://www.bbc.com/news/national-{i}",
+            summary,
+            (2024, 3, 10 + i, 10 + i, 0, 0),
+        )
+        for i, (title, summary) in enumerate(NON_LOCAL_ENTRIES)
+    ]
+    return tuple(local + non_local)
+
+
 class TestBBCSource:
     """Test suite for BBCSource class"""
 
@@ -54,20 +117,18 @@ class TestBBCSource:
             source.feed_url == "http://feeds.bbci.co.uk/news/england/manchester/rss.xml"
         )
 
-    def test_inherits_from_base_news_source(self):
+    def test_inherits_from_base_news_source(self, bbc_source):
         """Test that BBCSource properly inherits from BaseNewsSource"""
-        source = BBCSource()
-
-        assert isinstance(source, BaseNewsSource)
-        assert hasattr(source, "filter_articles")
-        assert callable(source.fetch_articles)
+        assert isinstance(bbc_source, BaseNewsSource)
+        assert hasattr(bbc_source, "filter_articles")
+        assert callable(bbc_source.fetch_articles)
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_success(self, mock_feedparser, mock_config):
+    def test_fetch_articles_success(
+        self, mock_feedparser, mock_config, bbc_source, caplog
+    ):
         """Test successful article fetching"""
         # Setup mock config
-        mock_config.KEYWORDS = ["stockport", "manchester", "macclesfield"]
+        mock_config.KEYWORDS = LOCAL_KEYWORDS
 
         # Setup mock feed data
         mock_entry1 = create_mock_rss_entry(
@@ -91,14 +152,11 @@ class TestBBCSource:
             # No published_parsed to test None handling
         )
 
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry1, mock_entry2, mock_entry3]
+        mock_feed = SimpleNamespace(entries=[mock_entry1, mock_entry2, mock_entry3])
         mock_feedparser.return_value = mock_feed
 
-        source = BBCSource()
-
-        with patch("logging.info") as mock_log_info:
-            articles = source.fetch_articles()
+        with caplog.at_level(logging.INFO):
+            articles = bbc_source.fetch_articles()
 
             # Should return 2 articles (Stockport and Manchester, not London)
             assert len(articles) == 2
@@ -118,7 +176,7 @@ class TestBBCSource:
             )
             assert articles[0]["original_source"] == "BBC News"
             assert articles[0]["source_type"] == "RSS News"
-            assert articles[0]["original_pubdate"] == datetime(2024, 3, 15, 10, 30, 0)
+            assert articles[0]["original_pubdate"] == PUBDATE_1030
 
             # Check second article
             assert articles[1]["original_title"] == "Manchester United transfer news"
@@ -134,31 +192,32 @@ class TestBBCSource:
             assert articles[1]["original_pubdate"] == datetime(2024, 3, 15, 14, 45, 0)
 
             # Verify logging
-            mock_log_info.assert_called_once_with("BBC: 2 articles found")
+            assert caplog.record_tuples == [
+                ("root", logging.INFO, "BBC: 2 articles found")
+            ]
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_empty_feed(self, mock_feedparser, mock_config):
+    def test_fetch_articles_empty_feed(
+        self, mock_feedparser, mock_config, bbc_source, caplog
+    ):
         """Test handling of empty RSS feed"""
         mock_config.KEYWORDS = ["stockport", "manchester"]
 
-        mock_feed = Mock()
-        mock_feed.entries = []
+        mock_feed = SimpleNamespace(entries=[])
         mock_feedparser.return_value = mock_feed
 
-        source = BBCSource()
-
-        with patch("logging.info") as mock_log_info:
-            articles = source.fetch_articles()
+        with caplog.at_level(logging.INFO):
+            articles = bbc_source.fetch_articles()
 
             assert articles == []
-            mock_log_info.assert_called_once_with("BBC: 0 articles found")
+            assert caplog.record_tuples == [
+                ("root", logging.INFO, "BBC: 0 articles found")
+            ]
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_no_matching_keywords(self, mock_feedparser, mock_config):
+    def test_fetch_articles_no_matching_keywords(
+        self, mock_feedparser, mock_config, bbc_source, caplog
+    ):
         """Test when no articles match the keywords"""
-        mock_config.KEYWORDS = ["stockport", "manchester", "macclesfield"]
+        mock_config.KEYWORDS = LOCAL_KEYWORDS
 
         mock_entry = create_mock_rss_entry(
             "London news update",
@@ -167,86 +226,108 @@ class TestBBCSource:
             (2024, 3, 15, 10, 30, 0),
         )
 
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry]
+        mock_feed = SimpleNamespace(entries=[mock_entry])
         mock_feedparser.return_value = mock_feed
 
-        source = BBCSource()
-
-        with patch("logging.info") as mock_log_info:
-            articles = source.fetch_articles()
+        with caplog.at_level(logging.INFO):
+            articles = bbc_source.fetch_articles()
 
             assert articles == []
-            mock_log_info.assert_called_once_with("BBC: 0 articles found")
-
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_missing_summary(self, mock_feedparser, mock_config):
-        """Test handling of entries without summary field"""
-        mock_config.KEYWORDS = ["stockport"]
-
-        mock_entry = create_mock_rss_entry(
-            "Stockport market reopens",
-            "https://www.bbc.com/news/stockport-market",
-            None,  # No summary
-            (2024, 3, 15, 10, 30, 0),
-        )
-
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry]
-        mock_feedparser.return_value = mock_feed
-
-        source = BBCSource()
-
-        articles = source.fetch_articles()
-
-        assert len(articles) == 1
-        assert articles[0]["original_summary"] == ""  # Should default to empty string
-
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_missing_published_date(self, mock_feedparser, mock_config):
-        """Test handling of entries without published_parsed field"""
-        mock_config.KEYWORDS = ["stockport"]
+            assert caplog.record_tuples == [
+                ("root", logging.INFO, "BBC: 0 articles found")
+            ]
+
+    @pytest.mark.parametrize(
+        "title,summary,published_parsed,expected_summary,expected_date",
+        [
+            pytest.param(
+                "Stockport market reopens",
+                None,
+                (2024, 3, 15, 10, 30, 0),
+                "",  # Should default to empty string
+                PUBDATE_1030,
+                id="missing-summary",
+            ),
+            pytest.param(
+                "Stockport festival announced",
+                "Annual cultural event details",
+                None,
+                "Annual cultural event details",
+                None,
+                id="missing-published-date",
+            ),
+            pytest.param(
+                "STOCKPORT MARKET UPDATE",  # Uppercase title, lowercase keyword
+                "Market renovation progress",
+                (2024, 3, 15, 10, 30, 0),
+                "Market renovation progress",
+                PUBDATE_1030,
+                id="case-insensitive",
+            ),
+            pytest.param(
+                "Stockport heritage project",
+                "Historical preservation initiative",
+                (2024, 3, 15, 10, 30, 0),
+                "Historical preservation initiative",
+                PUBDATE_1030,
+                id="all-fields",
+            ),
+        ],
+    )
+    def test_fetch_articles_single_entry(
+        self,
+        mock_feedparser,
+        mock_config,
+        bbc_source,
+        title,
+        summary,
+        published_parsed,
+        expected_summary,
+        expected_date,
+    ):
+        """Test that a single matching entry becomes exactly one article dict"""
+        mock_config.KEYWORDS = STOCKPORT_KEYWORDS
+        link = "https://www.bbc.com/news/stockport"
 
-        mock_entry = create_mock_rss_entry(
-            "Stockport festival announced",
-            "https://www.bbc.com/news/stockport-festival",
-            "Annual cultural event details",
-            # No published_parsed - omitted
+        mock_feed = SimpleNamespace(
+            entries=[create_mock_rss_entry(title, link, summary, published_parsed)]
         )
-
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry]
         mock_feedparser.return_value = mock_feed
 
-        source = BBCSource()
-
-        articles = source.fetch_articles()
-
-        assert len(articles) == 1
-        assert articles[0]["original_pubdate"] is None
+        articles = bbc_source.fetch_articles()
+
+        # Every field is preserved and no extra fields are added
+        assert articles == [
+            {
+                "original_title": title,
+                "original_link": link,
+                "original_summary": expected_summary,
+                "original_source": "BBC News",
+                "source_type": "RSS News",
+                "original_pubdate": expected_date,
+            }
+        ]
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_feedparser_exception(self, mock_feedparser, mock_config):
+    def test_fetch_articles_feedparser_exception(
+        self, mock_feedparser, mock_config, bbc_source, caplog
+    ):
         """Test handling of feedparser exceptions"""
-        mock_config.KEYWORDS = ["stockport"]
+        mock_config.KEYWORDS = STOCKPORT_KEYWORDS
         mock_feedparser.side_effect = Exception("Network error")
 
-        source = BBCSource()
-
-        with patch("logging.error") as mock_log_error:
-            articles = source.fetch_articles()
+        with caplog.at_level(logging.ERROR):
+            articles = bbc_source.fetch_articles()
 
             assert articles == []
-            mock_log_error.assert_called_once_with("BBC fetch error: Network error")
+            assert caplog.record_tuples == [
+                ("root", logging.ERROR, "BBC fetch error: Network error")
+            ]
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_malformed_date(self, mock_feedparser, mock_config):
+    def test_fetch_articles_malformed_date(
+        self, mock_feedparser, mock_config, bbc_source, caplog
+    ):
         """Test handling of malformed published_parsed dates"""
-        mock_config.KEYWORDS = ["stockport"]
+        mock_config.KEYWORDS = STOCKPORT_KEYWORDS
 
         mock_entry = create_mock_rss_entry(
             "Stockport development news",
@@ -255,22 +336,19 @@ class TestBBCSource:
             (2024, 3),  # Incomplete date tuple
         )
 
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry]
+        mock_feed = SimpleNamespace(entries=[mock_entry])
         mock_feedparser.return_value = mock_feed
 
-        source = BBCSource()
-
-        with patch("logging.error") as mock_log_error:
-            articles = source.fetch_articles()
+        with caplog.at_level(logging.ERROR):
+            articles = bbc_source.fetch_articles()
 
             # Should handle the error and return empty list
             assert articles == []
-            mock_log_error.assert_called_once()
+            assert [r.levelno for r in caplog.records] == [logging.ERROR]
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_keyword_filtering(self, mock_feedparser, mock_config):
+    def test_fetch_articles_keyword_filtering(
+        self, mock_feedparser, mock_config, bbc_source
+    ):
         """Test that keyword filtering works correctly"""
         mock_config.KEYWORDS = ["stockport", "manchester", "buxton"]
 
@@ -306,12 +384,10 @@ class TestBBCSource:
             ),
         ]
 
-        mock_feed = Mock()
-        mock_feed.entries = mock_entries
+        mock_feed = SimpleNamespace(entries=mock_entries)
         mock_feedparser.return_value = mock_feed
 
-        source = BBCSource()
-        articles = source.fetch_articles()
+        articles = bbc_source.fetch_articles()
 
         # Should return 3 articles (excluding London)
         assert len(articles) == 3
@@ -322,85 +398,14 @@ class TestBBCSource:
         assert "Greater Manchester transport" in titles
         assert "London weather forecast" not in titles
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_case_insensitive_filtering(
-        self, mock_feedparser, mock_config
-    ):
-        """Test that keyword filtering is case insensitive"""
-        mock_config.KEYWORDS = ["stockport"]  # lowercase
-
-        mock_entry = create_mock_rss_entry(
-            "STOCKPORT MARKET UPDATE",  # uppercase
-            "https://www.bbc.com/news/stockport-market",
-            "Market renovation progress",
-            (2024, 3, 15, 10, 30, 0),
-        )
-
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry]
-        mock_feedparser.return_value = mock_feed
-
-        source = BBCSource()
-        articles = source.fetch_articles()
-
-        # Should match despite case difference
-        assert len(articles) == 1
-        assert articles[0]["original_title"] == "STOCKPORT MARKET UPDATE"
-
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_fetch_articles_preserves_all_fields(self, mock_feedparser, mock_config):
-        """Test that all article fields are properly preserved"""
-        mock_config.KEYWORDS = ["stockport"]
-
-        mock_entry = create_mock_rss_entry(
-            "Stockport heritage project",
-            "https://www.bbc.com/news/stockport-heritage",
-            "Historical preservation initiative",
-            (2024, 3, 15, 10, 30, 0),
-        )
-
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry]
-        mock_feedparser.return_value = mock_feed
-
-        source = BBCSource()
-        articles = source.fetch_articles()
-
-        assert len(articles) == 1
-        article = articles[0]
-
-        # Check all expected fields are present and correct
-        assert article["original_title"] == "Stockport heritage project"
-        assert article["original_link"] == "https://www.bbc.com/news/stockport-heritage"
-        assert article["original_summary"] == "Historical preservation initiative"
-        assert article["original_source"] == "BBC News"
-        assert article["source_type"] == "RSS News"
-        assert article["original_pubdate"] == datetime(2024, 3, 15, 10, 30, 0)
-
-        # Ensure no extra fields are added
-        expected_keys = {
-            "original_title",
-            "original_link",
-            "original_summary",
-            "original_source",
-            "source_type",
-            "original_pubdate",
-        }
-        assert set(article.keys()) == expected_keys
-
-    def test_feed_url_is_correct(self):
+    def test_feed_url_is_correct(self, bbc_source):
         """Test that the RSS feed URL is correct"""
-        source = BBCSource()
         expected_url = "http://feeds.bbci.co.uk/news/england/manchester/rss.xml"
-        assert source.feed_url == expected_url
+        assert bbc_source.feed_url == expected_url
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_logging_behavior(self, mock_feedparser, mock_config):
+    def test_logging_behavior(self, mock_feedparser, mock_config, bbc_source, caplog):
         """Test that logging works correctly for both success and error cases"""
-        mock_config.KEYWORDS = ["stockport"]
+        mock_config.KEYWORDS = STOCKPORT_KEYWORDS
 
         # Test successful logging
         mock_entry = create_mock_rss_entry(
@@ -410,30 +415,37 @@ class TestBBCSource:
             (2024, 1, 1, 10, 0, 0),
         )
 
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry]
+        mock_feed = SimpleNamespace(entries=[mock_entry])
         mock_feedparser.return_value = mock_feed
 
-        with patch("logging.info") as mock_log_info:
-            source = BBCSource()
-            _ = source.fetch_articles()
-            mock_log_info.assert_called_once_with("BBC: 1 articles found")
+        with caplog.at_level(logging.INFO):
+            _ = bbc_source.fetch_articles()
+            assert caplog.record_tuples == [
+                ("root", logging.INFO, "BBC: 1 articles found")
+            ]
 
         # Test error logging
+        caplog.clear()
         mock_feedparser.side_effect = Exception("Test error")
 
-        with patch("logging.error") as mock_log_error:
-            source = BBCSource()
-            _ = source.fetch_articles()
-            mock_log_error.assert_called_once_with("BBC fetch error: Test error")
+        with caplog.at_level(logging.ERROR):
+            _ = bbc_source.fetch_articles()
+            assert caplog.record_tuples == [
+                ("root", logging.ERROR, "BBC fetch error: Test error")
+            ]
 
 
 class TestBBCSourceIntegration:
     """Integration tests for BBCSource"""
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_complete_workflow(self, mock_feedparser, mock_config):
+    def test_complete_workflow(
+        self,
+        mock_feedparser,
+        mock_config,
+        bbc_source,
+        caplog,
+        complete_workflow_entries,
+    ):
         """Test complete article fetching and filtering workflow"""
         mock_config.KEYWORDS = [
             "stockport",
@@ -443,118 +455,57 @@ class TestBBCSourceIntegration:
             "high peak",
         ]
 
-        # Create a realistic set of RSS entries
-        entries = []
-
-        # Local news that should be included
-        local_entries = [
-            (
-                "Stockport Market renovation begins",
-                "Construction work starts on historic market",
-            ),
-            (
-                "Manchester Airport expansion approved",
-                "Runway development gets green light",
-            ),
-            (
-                "Macclesfield festival cancelled",
-                "Annual event postponed due to weather",
-            ),
-            (
-                "High Peak hiking trails closed",
-                "Safety concerns prompt temporary closure",
-            ),
-            (
-                "Buxton Opera House reopens",
-                "Venue welcomes back audiences after refurbishment",
-            ),
-        ]
-
-        # Non-local news that should be excluded
-        non_local_entries = [
-            ("London Stock Market rises", "Financial markets show positive movement"),
-            ("Birmingham traffic delays", "City center construction causes disruption"),
-            ("Liverpool FC transfer news", "Football club confirms new signing"),
-        ]
-
-        # Add local entries
-        for i, (title, summary) in enumerate(local_entries):
-            entry = create_mock_rss_entry(
-                title,
-                f"https://www.bbc.com/news/local-{i}",
-                summary,
-                (2024, 3, i + 1, 10 + i, 0, 0),
-            )
-            entries.append(entry)
-
-        # Add non-local entries
-        for i, (title, summary) in enumerate(non_local_entries):
-            entry = create_mock_rss_entry(
-                title,
-                f"https://www.bbc.com/news/national-{i}",
-                summary,
-                (2024, 3, 10 + i, 10 + i, 0, 0),
-            )
-            entries.append(entry)
-
-        mock_feed = Mock()
-        mock_feed.entries = entries
+        mock_feed = SimpleNamespace(entries=complete_workflow_entries)
         mock_feedparser.return_value = mock_feed
 
-        source = BBCSource()
-
-        with patch("logging.info") as mock_log_info:
-            articles = source.fetch_articles()
+        with caplog.at_level(logging.INFO):
+            articles = bbc_source.fetch_articles()
 
             # Should return only the 5 local articles
             assert len(articles) == 5
 
             # Verify all local articles are included
             titles = [article["original_title"] for article in articles]
-            for title, _ in local_entries:
+            for title, _ in LOCAL_ENTRIES:
                 assert title in titles
 
             # Verify non-local articles are excluded
-            for title, _ in non_local_entries:
+            for title, _ in NON_LOCAL_ENTRIES:
                 assert title not in titles
 
             # Verify logging
-            mock_log_info.assert_called_once_with("BBC: 5 articles found")
-
-    @patch("sources.bbc_source.Config")
-    def test_error_recovery(self, mock_config):
-        """Test that BBCSource recovers gracefully from various errors"""
-        mock_config.KEYWORDS = ["stockport"]
-        source = BBCSource()
+            assert caplog.record_tuples == [
+                ("root", logging.INFO, "BBC: 5 articles found")
+            ]
 
-        # Test various error scenarios
-        error_scenarios = [
+    @pytest.mark.parametrize(
+        "error",
+        [
             Exception("Network timeout"),
             ConnectionError("Unable to connect"),
             ValueError("Invalid feed format"),
             KeyError("Missing required field"),
-        ]
-
-        for error in error_scenarios:
-            with (
-                patch("sources.bbc_source.feedparser.parse") as mock_feedparser,
-                patch("logging.error") as mock_log_error,
-            ):
-
-                mock_feedparser.side_effect = error
+        ],
+        ids=lambda error: type(error).__name__,
+    )
+    def test_error_recovery(
+        self, mock_feedparser, mock_config, bbc_source, caplog, error
+    ):
+        """Test that BBCSource recovers gracefully from various errors"""
+        mock_config.KEYWORDS = STOCKPORT_KEYWORDS
+        mock_feedparser.side_effect = error
 
-                articles = source.fetch_articles()
+        with caplog.at_level(logging.ERROR):
+            articles = bbc_source.fetch_articles()
 
-                # Should always return empty list on error
-                assert articles == []
+        # Should always return empty list on error
+        assert articles == []
 
-                # Should always log the error
-                mock_log_error.assert_called_once()
-                assert str(error) in mock_log_error.call_args[0][0]
+        # Should always log the error
+        assert len(caplog.records) == 1
+        assert str(error) in caplog.records[0].getMessage()
 
-    @patch("sources.bbc_source.Config")
-    @patch("sources.bbc_source.feedparser.parse")
-    def test_real_world_rss_structure(self, mock_feedparser, mock_config):
+    def test_real_world_rss_structure(self, mock_feedparser, mock_config, bbc_source):
         """Test with realistic RSS feed structure similar to actual BBC feeds"""
         mock_config.KEYWORDS = ["manchester"]
 
@@ -571,12 +522,10 @@ class TestBBCSourceIntegration:
         mock_entry.author = "BBC Sport"
         mock_entry.tags = [{"term": "Football"}, {"term": "Manchester United"}]
 
-        mock_feed = Mock()
-        mock_feed.entries = [mock_entry]
+        mock_feed = SimpleNamespace(entries=[mock_entry])
         mock_feedparser.return_value = mock_feed
 
-        source = BBCSource()
-        articles = source.fetch_articles()
+        articles = bbc_source.fetch_articles()
 
         assert len(articles) == 1
         article = articles[0]
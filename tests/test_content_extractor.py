@@ -135,7 +135,28 @@ class TestContentExtractor:
         assert "Mozilla/5.0" in extractor.headers["User-Agent"]
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    def test_session_reused_across_extractions(self, mock_sleep, extractor):
+        """Test that successive extractions share one Session"""
+        session = extractor.session
+        mock_response = Mock()
+        mock_response.content = b"<html><body><p>Test</p></body></html>"
+
+        with patch.object(session, "get", return_value=mock_response) as mock_get:
+            extractor.extract_content("https://www.bbc.com/news/one", "BBC News")
+            extractor.extract_content("https://www.bbc.com/news/two", "BBC News")
+
+        assert extractor.session is session
+        assert [c.args[0] for c in mock_get.call_args_list] == [
+            "https://www.bbc.com/news/one",
+            "https://www.bbc.com/news/two",
+        ]
+
+    def test_uses_lxml_parser(self, extractor):
+        """Test that the C-backed lxml parser is used when installed"""
+        assert extractor._parser == "lxml"
+
+    @patch("processors.content_extractor.time.sleep")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_bbc_content_success(
         self, mock_get, mock_sleep, extractor, mock_response, sample_bbc_html
     ):
@@ -148,11 +169,10 @@ class TestContentExtractor:
         )
 
         # Verify HTTP request
-        mock_get.assert_called_once_with(
-            "https://www.bbc.com/news/test-article", headers=extractor.headers
-        )
+        mock_get.assert_called_once_with("https://www.bbc.com/news/test-article")
         mock_response.raise_for_status.assert_called_once()
-        mock_sleep.assert_called_once_with(1)
+        # The first request has nothing to wait for
+        mock_sleep.assert_not_called()
 
         # Verify extracted content
         assert (
@@ -162,7 +182,7 @@ class TestContentExtractor:
         assert result["image_url"] == "https://example.com/bbc-image.jpg"
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_men_content_success(
         self, mock_get, mock_sleep, extractor, mock_response, sample_men_html
     ):
@@ -182,7 +202,7 @@ class TestContentExtractor:
         assert result["image_url"] == "https://example.com/men-image.jpg"
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_men_content_array(
         self, mock_get, mock_sleep, extractor, mock_response, sample_men_html_array
     ):
@@ -199,7 +219,7 @@ class TestContentExtractor:
         assert result["image_url"] == "https://example.com/men-array-image.jpg"
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_nub_content_success(
         self, mock_get, mock_sleep, extractor, mock_response, sample_nub_html
     ):
@@ -219,7 +239,7 @@ class TestContentExtractor:
         assert result["image_url"] == "https://example.com/nub-image.jpg"
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_generic_content_success(
         self, mock_get, mock_sleep, extractor, mock_response, sample_generic_html
     ):
@@ -237,7 +257,34 @@ class TestContentExtractor:
         assert result["image_url"] == "https://example.com/generic-image.jpg"
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
+    def test_extract_generic_content_skips_unused_tags(
+        self, mock_get, mock_sleep, extractor, mock_response, sample_generic_html
+    ):
+        """Test that tags the extractor never reads are not built into the soup"""
+        padded_html = sample_generic_html.replace(
+            "</head>", f"<script>{'var x = 1;' * 1000}</script></head>"
+        )
+        mock_response.content = padded_html.encode("utf-8")
+        mock_get.return_value = mock_response
+
+        with patch.object(
+            extractor,
+            "_extract_generic_content",
+            wraps=extractor._extract_generic_content,
+        ) as mock_generic:
+            result = extractor.extract_content(
+                "https://example.com/news/test", "Generic Source"
+            )
+
+        soup = mock_generic.call_args[0][0]
+        assert soup.find("script") is None
+        assert soup.find("body") is None
+        assert result["content"].startswith("First paragraph of generic content.")
+        assert result["image_url"] == "https://example.com/generic-image.jpg"
+
+    @patch("processors.content_extractor.time.sleep")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_content_http_error(self, mock_get, mock_sleep, extractor):
         """Test handling of HTTP errors"""
         mock_get.side_effect = requests.exceptions.HTTPError("404 Not Found")
@@ -255,11 +302,11 @@ class TestContentExtractor:
             assert "Content extraction error" in mock_logging.call_args[0][0]
             assert "https://example.com/not-found" in mock_logging.call_args[0][0]
 
-        # Should still call sleep in finally block
-        mock_sleep.assert_called_once_with(1)
+        # The first request has nothing to wait for
+        mock_sleep.assert_not_called()
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_content_connection_error(self, mock_get, mock_sleep, extractor):
         """Test handling of connection errors"""
         mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
@@ -273,7 +320,7 @@ class TestContentExtractor:
             mock_logging.assert_called_once()
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_content_timeout_error(self, mock_get, mock_sleep, extractor):
         """Test handling of timeout errors"""
         mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
@@ -287,7 +334,7 @@ class TestContentExtractor:
             mock_logging.assert_called_once()
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_men_content_invalid_json(
         self, mock_get, mock_sleep, extractor, mock_response
     ):
@@ -312,7 +359,7 @@ class TestContentExtractor:
         assert result["image_url"] == "https://example.com/image.jpg"
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_men_content_no_json_ld(
         self, mock_get, mock_sleep, extractor, mock_response
     ):
@@ -336,7 +383,7 @@ class TestContentExtractor:
         assert result["image_url"] == "https://example.com/image.jpg"
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_content_no_og_image(
         self, mock_get, mock_sleep, extractor, mock_response
     ):
@@ -357,7 +404,7 @@ class TestContentExtractor:
         assert result["image_url"] == ""
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_nub_content_missing_elements(
         self, mock_get, mock_sleep, extractor, mock_response
     ):
@@ -381,7 +428,7 @@ class TestContentExtractor:
         assert result["image_url"] == ""  # No image div found
 
     @patch("processors.content_extractor.time.sleep")
-    @patch("processors.content_extractor.requests.get")
+    @patch("processors.content_extractor.requests.Session.get")
     def test_extract_bbc_content_no_paragraphs(
         self, mock_get, mock_sleep, extractor, mock_response
     ):
@@ -409,7 +456,7 @@ class TestContentExtractor:
             mock_bbc.return_value = {"content": "BBC content", "image_url": "bbc.jpg"}
 
             with (
-                patch("processors.content_extractor.requests.get") as mock_get,
+                patch("processors.content_extractor.requests.Session.get") as mock_get,
                 patch("processors.content_extractor.time.sleep"),
             ):
 
@@ -429,7 +476,7 @@ class TestContentExtractor:
             mock_men.return_value = {"content": "MEN content", "image_url": "men.jpg"}
 
             with (
-                patch("processors.content_extractor.requests.get") as mock_get,
+                patch("processors.content_extractor.requests.Session.get") as mock_get,
                 patch("processors.content_extractor.time.sleep"),
             ):
 
@@ -449,7 +496,7 @@ class TestContentExtractor:
             mock_nub.return_value = {"content": "Nub content", "image_url": "nub.jpg"}
 
             with (
-                patch("processors.content_extractor.requests.get") as mock_get,
+                patch("processors.content_extractor.requests.Session.get") as mock_get,
                 patch("processors.content_extractor.time.sleep"),
             ):
 
@@ -472,7 +519,7 @@ class TestContentExtractor:
             }
 
             with (
-                patch("processors.content_extractor.requests.get") as mock_get,
+                patch("processors.content_extractor.requests.Session.get") as mock_get,
                 patch("processors.content_extractor.time.sleep"),
             ):
 
@@ -491,39 +538,45 @@ class TestContentExtractorIntegration:
     """Integration tests for ContentExtractor"""
 
     def test_rate_limiting_sleep(self):
-        """Test that rate limiting sleep is always called"""
+        """Test that requests are spaced at least one second apart"""
         extractor = ContentExtractor()
 
         with (
-            patch("processors.content_extractor.requests.get") as mock_get,
+            patch("processors.content_extractor.requests.Session.get") as mock_get,
             patch("processors.content_extractor.time.sleep") as mock_sleep,
+            patch("processors.content_extractor.time.monotonic") as mock_monotonic,
         ):
-
-            # Test successful case
             mock_response = Mock()
             mock_response.content = b"<html><body><p>Test</p></body></html>"
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
 
+            # First request goes straight out
+            mock_monotonic.return_value = 100.0
             extractor.extract_content("https://example.com/test", "Test")
-            mock_sleep.assert_called_with(1)
+            mock_sleep.assert_not_called()
 
-            # Reset and test error case
-            mock_sleep.reset_mock()
+            # A request 0.25s later waits out the rest of the interval,
+            # even when the previous request failed
             mock_get.side_effect = Exception("Test error")
-
+            mock_monotonic.return_value = 100.25
             with patch("logging.error"):
                 extractor.extract_content("https://example.com/error", "Test")
+            mock_sleep.assert_called_once_with(0.75)
 
-            # Should still sleep even on error
-            mock_sleep.assert_called_with(1)
+            # Once the interval has already passed there is no wait
+            mock_sleep.reset_mock()
+            mock_monotonic.return_value = 102.0
+            with patch("logging.error"):
+                extractor.extract_content("https://example.com/error", "Test")
+            mock_sleep.assert_not_called()
 
     def test_user_agent_header(self):
         """Test that User-Agent header is correctly set"""
         extractor = ContentExtractor()
 
         with (
-            patch("processors.content_extractor.requests.get") as mock_get,
+            patch("processors.content_extractor.requests.Session.get") as mock_get,
             patch("processors.content_extractor.time.sleep"),
         ):
 
@@ -533,8 +586,8 @@ class TestContentExtractorIntegration:
 
             extractor.extract_content("https://example.com/test", "Test")
 
-            # Verify headers were passed
-            args, kwargs = mock_get.call_args
-            assert "headers" in kwargs
-            assert "User-Agent" in kwargs["headers"]
-            assert "Mozilla/5.0" in kwargs["headers"]["User-Agent"]
+            # Headers travel on the shared session rather than per call
+            mock_get.assert_called_once_with("https://example.com/test")
+            user_agent = extractor.session.headers["User-Agent"]
+            assert user_agent == extractor.headers["User-Agent"]
+            assert "Mozilla/5.0" in user_agent
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test suite for StockportCouncilSource class
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from sources.stockportcouncil_source import StockportCouncilSource
+
+# Plain data as returned by EXTRACT_ARTICLES_JS
+MATCHING_ITEM = {
+    "title": "Stockport town centre gets new cycle lanes",
+    "href": "/news/cycle-lanes",
+    "datetimeAttr": "2024-03-15T10:30:00Z",
+    "dateText": "15 March 2024",
+    "summary": "Work begins next month",
+}
+NON_MATCHING_ITEM = {
+    "title": "National bin collection survey opens",
+    "href": "/news/bin-survey",
+    "datetimeAttr": None,
+    "dateText": "16 March 2024",
+    "summary": "Have your say on waste services",
+}
+
+
+@pytest.fixture
+def mock_page(monkeypatch):
+    """Fake browser page whose evaluate() result the tests supply"""
+    page = MagicMock()
+    page.url = "https://www.stockport.gov.uk/landing/news-media"
+    playwright = MagicMock()
+    browser = playwright.chromium.launch.return_value
+    browser.new_context.return_value.new_page.return_value = page
+    manager = MagicMock()
+    manager.__enter__.return_value = playwright
+    monkeypatch.setattr(
+        "sources.stockportcouncil_source.sync_playwright", lambda: manager
+    )
+    return page
+
+
+class TestStockportCouncilSource:
+    """Test suite for StockportCouncilSource class"""
+
+    def test_fetch_articles_filters_by_keyword(self, mock_page, mock_config):
+        """Test that matching items are kept and non-matching items dropped"""
+        mock_page.evaluate.return_value = [MATCHING_ITEM, NON_MATCHING_ITEM]
+
+        articles = StockportCouncilSource().fetch_articles()
+
+        assert len(articles) == 1
+        article = articles[0]
+        assert article["original_title"] == MATCHING_ITEM["title"]
+        assert article["original_summary"] == "Work begins next month"
+        assert article["original_source"] == "Stockport Council"
+        assert article["source_type"] == "Web Scraping (Playwright)"
+        assert article["original_pubdate"] == datetime.fromisoformat(
+            "2024-03-15T10:30:00+00:00"
+        )
+
+    def test_fetch_articles_matches_on_summary(self, mock_page, mock_config):
+        """Test that a keyword in the summary alone is enough to match"""
+        item = dict(NON_MATCHING_ITEM, summary="Residents across Stockport asked")
+        mock_page.evaluate.return_value = [item]
+
+        articles = StockportCouncilSource().fetch_articles()
+
+        assert [a["original_title"] for a in articles] == [item["title"]]
+        assert articles[0]["original_pubdate"] == datetime(2024, 3, 16)
+
+    @pytest.mark.parametrize(
+        "href,expected",
+        [
+            ("article-x", "https://www.stockport.gov.uk/landing/article-x"),
+            ("/news/article-x", "https://www.stockport.gov.uk/news/article-x"),
+            ("//news.stockport.gov.uk/x", "https://news.stockport.gov.uk/x"),
+            ("https://example.com/x", "https://example.com/x"),
+        ],
+        ids=["relative", "root-relative", "scheme-relative", "absolute"],
+    )
+    def test_links_resolve_against_listing_page(
+        self, mock_page, mock_config, href, expected
+    ):
+        """Test that hrefs are resolved relative to the listing page URL"""
+        mock_page.evaluate.return_value = [dict(MATCHING_ITEM, href=href)]
+
+        articles = StockportCouncilSource().fetch_articles()
+
+        assert articles[0]["original_link"] == expected
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Test suite for TotallyStockportSource class
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from sources.totallystockport_source import TotallyStockportSource
+
+LISTING_HTML = """
+<html>
+    <body>
+        <article class="post">
+            <h2><a href="https://totallystockport.co.uk/market-reopens/">Stockport market reopens</a></h2>
+            <span class="updated">December 2, 2024</span>
+            <div class="post-content"><p>Traders return to the Market Hall [...]</p></div>
+        </article>
+        <article class="post">
+            <h2><a href="https://totallystockport.co.uk/london-news/">London bus fares rise</a></h2>
+            <span class="updated">December 3, 2024</span>
+            <div class="post-content"><p>Capital commuters face higher costs</p></div>
+        </article>
+    </body>
+</html>
+"""
+
+
+def create_mock_response(html="", status_code=200, headers=None, charset="utf-8"):
+    """Helper function to create a streamed response usable as a context manager"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content.return_value = [html.encode(charset)]
+    response.__enter__.return_value = response
+    return response
+
+
+@pytest.fixture
+def mock_get(monkeypatch):
+    """Mocked requests.get that serves the Totally Stockport listing"""
+    get = Mock()
+    monkeypatch.setattr("sources.totallystockport_source.requests.get", get)
+    return get
+
+
+class TestTotallyStockportSource:
+    """Test suite for TotallyStockportSource class"""
+
+    def test_fetch_articles_filters_by_keyword(self, mock_get, mock_config):
+        """Test that matching posts are parsed and non-matching posts dropped"""
+        mock_get.return_value = create_mock_response(LISTING_HTML)
+
+        articles = TotallyStockportSource().fetch_articles()
+
+        assert articles == [
+            {
+                "original_title": "Stockport market reopens",
+                "original_link": "https://totallystockport.co.uk/market-reopens/",
+                "original_summary": "Traders return to the Market Hall",
+                "original_source": "Totally Stockport",
+                "source_type": "Web Scraping",
+                "original_pubdate": datetime(2024, 12, 2),
+            }
+        ]
+
+    def test_first_fetch_sends_no_validators(self, mock_get, mock_config):
+        """Test that the first request is unconditional"""
+        mock_get.return_value = create_mock_response(LISTING_HTML)
+
+        TotallyStockportSource().fetch_articles()
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert "If-None-Match" not in headers
+        assert "If-Modified-Since" not in headers
+
+    def test_second_fetch_sends_validators(self, mock_get, mock_config):
+        """Test that validators from the last response are sent back"""
+        source = TotallyStockportSource()
+        mock_get.return_value = create_mock_response(
+            LISTING_HTML,
+            headers={
+                "ETag": '"abc123"',
+                "Last-Modified": "Mon, 02 Dec 2024 09:00:00 GMT",
+            },
+        )
+        source.fetch_articles()
+
+        source.fetch_articles()
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc123"'
+        assert headers["If-Modified-Since"] == "Mon, 02 Dec 2024 09:00:00 GMT"
+        assert "If-None-Match" not in source.headers
+
+    def test_not_modified_returns_cached_articles(self, mock_get, mock_config):
+        """Test that a 304 serves the previous articles without parsing"""
+        source = TotallyStockportSource()
+        mock_get.return_value = create_mock_response(
+            LISTING_HTML, headers={"ETag": '"abc123"'}
+        )
+        first = source.fetch_articles()
+
+        not_modified = create_mock_response(status_code=304)
+        mock_get.return_value = not_modified
+        second = source.fetch_articles()
+
+        assert second == first
+        not_modified.iter_content.assert_not_called()
+        not_modified.raise_for_status.assert_not_called()
+
+    def test_not_modified_ignores_caller_changes(self, mock_get, mock_config):
+        """Test that mutating returned articles does not leak into the cache"""
+        source = TotallyStockportSource()
+        mock_get.return_value = create_mock_response(
+            LISTING_HTML, headers={"ETag": '"abc123"'}
+        )
+        first = source.fetch_articles()
+        first[0]["original_title"] = "Edited by caller"
+        first.clear()
+
+        mock_get.return_value = create_mock_response(status_code=304)
+        second = source.fetch_articles()
+        second[0]["original_summary"] = "Edited again"
+
+        third = source.fetch_articles()
+
+        assert len(third) == 1
+        assert third[0]["original_title"] == "Stockport market reopens"
+        assert third[0]["original_summary"] == "Traders return to the Market Hall"
+
+    @pytest.mark.parametrize(
+        "headers,charset",
+        [
+            ({}, "utf-8"),
+            ({"Content-Type": "text/html"}, "utf-8"),
+            ({"Content-Type": "text/html; charset=UTF-8"}, "utf-8"),
+            ({"Content-Type": "text/html; charset=windows-1252"}, "cp1252"),
+            ({"Content-Type": "text/html; charset=bogus"}, "utf-8"),
+        ],
+        ids=["no-header", "no-charset", "utf-8", "cp1252", "unknown-charset"],
+    )
+    def test_non_ascii_text_is_decoded(self, mock_get, mock_config, headers, charset):
+        """Test that pages without <meta charset> decode non-ASCII text correctly"""
+        html = LISTING_HTML.replace(
+            "Stockport market reopens", "Stockport café reopens — news"
+        )
+        mock_get.return_value = create_mock_response(
+            html, headers=headers, charset=charset
+        )
+
+        articles = TotallyStockportSource().fetch_articles()
+
+        assert articles[0]["original_title"] == "Stockport café reopens — news"
+
+    @pytest.mark.parametrize(
+        "meta",
+        [
+            '<meta charset="iso-8859-1">',
+            '<meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1">',
+        ],
+        ids=["meta-charset", "http-equiv"],
+    )
+    def test_meta_charset_is_honoured(self, mock_get, mock_config, meta):
+        """Test that <meta charset> applies when the header names no charset"""
+        html = LISTING_HTML.replace("<html>", f"<html><head>{meta}</head>", 1).replace(
+            "Stockport market reopens", "Stockport café reopens"
+        )
+        mock_get.return_value = create_mock_response(
+            html, headers={"Content-Type": "text/html"}, charset="iso-8859-1"
+        )
+
+        articles = TotallyStockportSource().fetch_articles()
+
+        assert articles[0]["original_title"] == "Stockport café reopens"